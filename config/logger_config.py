@@ -1,10 +1,216 @@
 import os
+import sys
+import atexit
+import functools
+import queue
 import logging
+import threading
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
 # Define the directory where log files will be stored
 LOGGING_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
-os.makedirs(LOGGING_DIR, exist_ok=True)
+_dir_ready = False
+
+# Records below this level are dropped by the logger itself, before any message is interpolated or queued
+LOG_LEVEL = os.getenv('DBMCP_LOG_LEVEL', 'INFO').upper()
+
+# Buffered log files are flushed after this many records or this many seconds, whichever comes first
+FLUSH_EVERY_RECORDS = 100
+FLUSH_INTERVAL_SECONDS = 1.0
+
+class BufferedFileHandler(logging.Handler):
+    """
+    A file handler that writes through a 64 KiB buffer instead of flushing every record.
+    """
+
+    def __init__(self, file_path: str, flush_every: int = FLUSH_EVERY_RECORDS, buffer_size: int = 64 * 1024):
+        super().__init__()
+        self.flush_every = flush_every
+        self._stream = open(file_path, 'ab', buffering=buffer_size)
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._stream.write((self.format(record) + '\n').encode('utf-8'))
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._pending and not self._stream.closed:
+                self._stream.flush()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self.lock:
+            self.flush()
+            self._stream.close()
+        super().close()
+
+# io_uring ring size, and the most buffers submitted with a single io_uring_enter
+URING_ENTRIES = 256
+URING_BATCH = 64
+
+class UringFileHandler(logging.Handler):
+    """
+    A file handler that batches records and writes them through io_uring, one submission per batch.
+
+    Buffers in a batch are linked so they land in the file in order. Requires Linux and the
+    optional liburing package.
+    """
+
+    def __init__(self, file_path: str, flush_every: int = FLUSH_EVERY_RECORDS):
+        super().__init__()
+        self.flush_every = flush_every
+        self._fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        try:
+            liburing.io_uring_queue_init(URING_ENTRIES, self._ring)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self._pending: List[bytes] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._pending.append((self.format(record) + '\n').encode('utf-8'))
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        with self.lock:
+            while self._pending and self._fd >= 0:
+                batch = self._pending[:URING_BATCH]
+                del self._pending[:URING_BATCH]
+                self._submit(batch)
+
+    def _submit(self, buffers: List[bytes]) -> None:
+        for index, buffer in enumerate(buffers):
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_write(sqe, self._fd, buffer)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+            if index < len(buffers) - 1:
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+        liburing.io_uring_submit(self._ring)
+        liburing.io_uring_wait_cqe_nr(self._ring, self._cqe, len(buffers))
+
+        written = [0] * len(buffers)
+        for index in range(len(buffers)):
+            entry = self._cqe[index]
+            try:
+                written[entry.user_data] = entry.res or 0
+            except OSError:
+                pass
+        liburing.io_uring_cq_advance(self._ring, len(buffers))
+
+        # A failed or short write cancels the rest of the chain; finish those synchronously, in order
+        for buffer, count in zip(buffers, written):
+            view = memoryview(buffer)[max(count, 0):]
+            while view:
+                view = view[os.write(self._fd, view):]
+
+    def close(self) -> None:
+        with self.lock:
+            self.flush()
+            if self._fd >= 0:
+                liburing.io_uring_queue_exit(self._ring)
+                os.close(self._fd)
+                self._fd = -1
+        super().close()
+
+def _file_handler(file_path: str) -> logging.Handler:
+    # io_uring writes are opt-in and only available on Linux with liburing installed
+    if os.getenv('DBMCP_URING_LOG') == '1' and liburing is not None and sys.platform.startswith('linux'):
+        try:
+            return UringFileHandler(file_path)
+        except OSError:
+            pass
+    return BufferedFileHandler(file_path)
+
+class _FileRouter(logging.Handler):
+    """
+    Dispatches records on the listener thread to the file handler of the logger that produced them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers: Dict[str, logging.Handler] = {}
+
+    def add(self, logger_name: str, handler: logging.Handler) -> None:
+        self._handlers[logger_name] = handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handler = self._handlers.get(record.name)
+        if handler is not None:
+            handler.handle(record)
+
+    def flush(self) -> None:
+        for handler in list(self._handlers.values()):
+            handler.flush()
+
+    def close(self) -> None:
+        for handler in list(self._handlers.values()):
+            handler.close()
+        super().close()
+
+# Loggers only enqueue records; a single listener thread formats log lines and performs all file and console I/O
+_log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(-1)
+_file_router = _FileRouter()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+_stopped = threading.Event()
+
+def _formatter() -> logging.Formatter:
+    return logging.Formatter(
+        '%(asctime)s %(levelname)s:%(name)s %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+def _flush_periodically() -> None:
+    while not _stopped.wait(FLUSH_INTERVAL_SECONDS):
+        _file_router.flush()
+
+def _shutdown() -> None:
+    _stopped.set()
+    if _listener is not None:
+        _listener.stop()
+    _file_router.close()
+
+def _ensure_logging_dir() -> None:
+    # Created on first use rather than at import, so importing this module touches no files
+    global _dir_ready
+    if not _dir_ready:
+        os.makedirs(LOGGING_DIR, exist_ok=True)
+        _dir_ready = True
+
+def _ensure_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+
+        # Create console handler with a higher log level
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_formatter())
+
+        _listener = QueueListener(_log_queue, _file_router, console_handler, respect_handler_level=True)
+        _listener.start()
+        threading.Thread(target=_flush_periodically, name='log-flusher', daemon=True).start()
+        atexit.register(_shutdown)
 
 class LoggerFactory:
     """
@@ -12,9 +218,19 @@ class LoggerFactory:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_logger(name: str) -> Logger:
         """
-        Retrieves a logger with the specified name, configuring it if necessary.
+        Retrieves a logger with the specified name, configuring it on first request.
+
+        Results are memoized per name, so later calls return the configured logger without going
+        through logging.getLogger and its module lock.
+
+        The logger level is DBMCP_LOG_LEVEL (INFO by default), so DEBUG calls return before doing any
+        work unless debugging is switched on. Records that pass are interpolated on the calling thread
+        (QueueHandler.prepare does that so they can be queued safely) and then enqueued; formatting the
+        log line and all disk/console writes happen on a background listener thread, so logging never
+        blocks the caller on I/O.
 
         Args:
             name (str): The name of the logger.
@@ -23,29 +239,21 @@ class LoggerFactory:
             Logger: Configured logger instance.
         """
         logger = logging.getLogger(f'log_namespace.{name}')
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(LOG_LEVEL)
 
         if not logger.handlers:
-            # Create file handler which logs debug and higher level messages
+            _ensure_listener()
+
+            # Create buffered file handler which logs debug and higher level messages
+            _ensure_logging_dir()
             file_path = os.path.join(LOGGING_DIR, f'{name}.log')
-            file_handler = logging.FileHandler(file_path)
+            file_handler = _file_handler(file_path)
             file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_formatter())
+            _file_router.add(logger.name, file_handler)
 
-            # Create console handler with a higher log level
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.INFO)
-
-            # Create formatter and add it to the handlers
-            formatter = logging.Formatter(
-                '%(asctime)s %(levelname)s:%(name)s %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(formatter)
-            console_handler.setFormatter(formatter)
-
-            # Add the handlers to the logger
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            # Hand records to the listener thread instead of writing them here
+            logger.addHandler(QueueHandler(_log_queue))
 
             # Prevent log messages from being propagated to the root logger
             logger.propagate = False
@@ -1,13 +1,15 @@
 from config.mcp_config import mcp
-from mysqldb.services.schema import get_schema,get_tables, get_table_description
-from mysqldb.services.reads import get_all_rows, get_filtered_rows, get_sorted_rows, get_limited_rows, get_distinct_values, get_aggregated_data, get_grouped_data, execute_custom_query
-from mysqldb.services.ddl import create_table, drop_table, show_indexes, create_index
+from mysqldb.services.schema import get_schema,get_tables, get_table_description, get_table_descriptions
+from mysqldb.services.reads import get_all_rows, get_rows, get_rows_in, get_filtered_rows, get_sorted_rows, get_limited_rows, get_distinct_values, get_aggregated_data, get_grouped_data, execute_custom_query, stream_rows, get_page_after
+from mysqldb.services.ddl import create_table, drop_table, show_indexes, create_index, create_indexes
 from mysqldb.services.dml import insert_row, insert_multiple_rows, delete_rows, update_rows
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple, Union
+
+import asyncio
 
 @mcp.tool()
-def mysql_get_tables(host:str, user:str, password:str, database:str, port:int = 3306) -> Optional[List[str]] :
+async def mysql_get_tables(host:str, user:str, password:str, database:str, port:int = 3306) -> Optional[List[str]] :
     """
     Retrieves the list of table names in a MySQL database.
 
@@ -21,10 +23,10 @@ def mysql_get_tables(host:str, user:str, password:str, database:str, port:int =
     Returns:
         Optional[List[str]]: A list of table names if successful, otherwise None.
     """
-    return get_tables(host=host, user=user, password=password, database=database, port=port)
+    return await asyncio.to_thread(get_tables, host, user, password, database, port)
 
 @mcp.tool()
-def mysql_get_schema(host:str, user:str, password:str, database:str, port:int = 3306) -> Optional[Dict[str, list]] :
+async def mysql_get_schema(host:str, user:str, password:str, database:str, port:int = 3306) -> Optional[Dict[str, list]] :
     """
     Retrieves the schema of a given MySQL database as a dictionary.
 
@@ -39,10 +41,10 @@ def mysql_get_schema(host:str, user:str, password:str, database:str, port:int =
         Optional[Dict[str, list]]: A dictionary where keys are table names and values are lists of column definitions.
         Returns None if the connection or table retrieval fails.
     """
-    return get_schema(host=host, user=user, password=password, database=database, port=port)
+    return await asyncio.to_thread(get_schema, host, user, password, database, port)
 
 @mcp.tool()
-def mysql_get_table_description(host:str, user:str, password:str, database:str, table_name:str, port:int = 3306) -> Optional[Dict[str, list]] :
+async def mysql_get_table_description(host:str, user:str, password:str, database:str, table_name:str, port:int = 3306) -> Optional[Dict[str, list]] :
     """
     Retrieves the schema of a specific table from a given MySQL database.
 
@@ -58,12 +60,85 @@ def mysql_get_table_description(host:str, user:str, password:str, database:str,
         Optional[Dict[str, list]]: A dictionary where the key is the table name and the value is a list of column definitions.
         Returns None if the connection or schema retrieval fails.
     """
-    return get_table_description(host=host, user=user, password=password, database=database, table_name=table_name, port=port)
+    return await asyncio.to_thread(get_table_description, host, user, password, database, table_name, port)
+
+@mcp.tool()
+async def mysql_get_table_descriptions(host:str, user:str, password:str, database:str, tables:List[str], port:int = 3306) -> Optional[Dict[str, list]] :
+    """
+    Retrieves the schemas of several tables from a given MySQL database in a single query.
+
+    Args:
+        host (str): The host address of the MySQL server.
+        user (str): The username to authenticate with.
+        password (str): The password for the MySQL user.
+        database (str): The name of the database containing the tables.
+        tables (List[str]): The names of the tables to retrieve the schemas of.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[Dict[str, list]]: A dictionary where keys are table names and values are lists of column definitions.
+        Tables that do not exist are left out. Returns None if the connection or schema retrieval fails.
+    """
+    return await asyncio.to_thread(get_table_descriptions, host, user, password, database, tables, port)
+
+@mcp.tool()
+async def mysql_get_all_rows(host:str, user:str, password:str, database:str, table_name:str, port:int = 3306) -> Optional[Dict[str, list]]:
+    """
+    Retrieves all rows from the specified table in the given database, up to the server's DBMCP_MAX_ROWS cap.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The name of the database.
+        table_name (str): The name of the table to fetch data from.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[Dict[str, list]]: {"columns": [...], "rows": [[...], ...]} where "columns" lists the column names once
+        and each entry of "rows" holds one row's values in that column order. Returns None if an error occurs.
+    """
+    return await asyncio.to_thread(get_all_rows, host, user, password, database, table_name, port)
+
+@mcp.tool()
+async def mysql_get_rows(
+    host: str, user: str, password: str, database: str, table_name: str, filters: Optional[Dict[str, Any]] = None,
+    sort_by: Optional[str] = None, order: str = 'ASC', limit: Optional[int] = None, offset: int = 0, port: int = 3306,
+    columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
+    """
+    Retrieves rows from the specified table, filtered, sorted and paginated in a single query.
+    Prefer this over separate filter, sort and limit calls.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The name of the database.
+        table_name (str): The name of the table to fetch data from.
+        filters (Optional[Dict[str, Any]]): Column names mapped to the values they must equal.
+        sort_by (Optional[str]): The column to sort by.
+        order (str): The sort order ('ASC' or 'DESC'). Default is 'ASC'.
+        limit (Optional[int]): The maximum number of rows to fetch.
+        offset (int): The number of rows to skip; only applies together with limit.
+        port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
+
+    Returns:
+        Optional[Union[List[Dict], Dict[str, list]]]: The rows as a list of dictionaries (or in columnar shape),
+        or None on error.
+    """
+    return await asyncio.to_thread(get_rows, host, user, password, database, table_name, filters, sort_by, order, limit, offset, port, columnar)
 
 @mcp.tool()
-def mysql_get_all_rows(host:str, user:str, password:str, database:str, table_name:str, port:int = 3306) -> Optional[List[Dict]]:
+async def mysql_get_rows_in(
+    host: str, user: str, password: str, database: str, table_name: str, column: str, values: List[Any], port: int = 3306,
+    columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
-    Retrieves all rows from the specified table in the given database.
+    Retrieves every row whose column equals one of the given values in a single call.
+    Prefer this over one filtered lookup per value.
 
     Args:
         host (str): The database host.
@@ -71,16 +146,20 @@ def mysql_get_all_rows(host:str, user:str, password:str, database:str, table_nam
         password (str): The database password.
         database (str): The name of the database.
         table_name (str): The name of the table to fetch data from.
+        column (str): The column to match, typically a primary or unique key.
+        values (List[Any]): The values to look up.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
 
     Returns:
-        Optional[List[Dict]]: A list of dictionaries where each dictionary represents a row from the table.
-        Returns None if an error occurs or the table is empty.
+        Optional[Union[List[Dict], Dict[str, list]]]: The matching rows in no particular order, as a list of dictionaries
+        (or in columnar shape), or None on error.
     """
-    return get_all_rows(host=host, user=user, password=password, database=database, table_name=table_name, port=port)
+    return await asyncio.to_thread(get_rows_in, host, user, password, database, table_name, column, values, port, columnar)
 
 @mcp.tool()
-def mysql_get_filtered_rows(host: str, user: str, password: str, database: str, table_name: str, filters: Dict[str, Any], port: int = 3306) -> Optional[List[Dict]]:
+async def mysql_get_filtered_rows(host: str, user: str, password: str, database: str, table_name: str, filters: Dict[str, Any], port: int = 3306, columnar: bool = False) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Retrieves rows from the specified table in the given database based on filter criteria.
 
@@ -92,15 +171,18 @@ def mysql_get_filtered_rows(host: str, user: str, password: str, database: str,
         table_name (str): The name of the table to fetch data from.
         filters (Dict[str, Any]): A dictionary where keys are column names and values are the filtering criteria.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
 
     Returns:
-        Optional[List[Dict]]: A list of dictionaries where each dictionary represents a row from the table.
+        Optional[Union[List[Dict], Dict[str, list]]]: A list of dictionaries where each dictionary represents a row from the table,
+        or the columnar shape if requested.
         Returns None if an error occurs or no data matches the filters.
     """
-    return get_filtered_rows(host, user, password, database, table_name, filters, port=port)
+    return await asyncio.to_thread(get_filtered_rows, host, user, password, database, table_name, filters, port, columnar)
 
 @mcp.tool()
-def mysql_get_sorted_rows(host: str, user: str, password: str, database: str, table_name: str, sort_by: str, order: str = 'ASC', port: int = 3306)  -> Optional[List[Dict]]:
+async def mysql_get_sorted_rows(host: str, user: str, password: str, database: str, table_name: str, sort_by: str, order: str = 'ASC', port: int = 3306, columnar: bool = False)  -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Retrieves sorted rows from the specified table.
 
@@ -113,14 +195,16 @@ def mysql_get_sorted_rows(host: str, user: str, password: str, database: str, ta
         sort_by (str): The column to sort by.
         order (str): The sort order ('ASC' or 'DESC'). Default is 'ASC'.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
 
     Returns:
-        Optional[List[Dict]]: Sorted rows as a list of dictionaries, or None on error.
+        Optional[Union[List[Dict], Dict[str, list]]]: Sorted rows as a list of dictionaries (or in columnar shape), or None on error.
     """
-    return get_sorted_rows(host, user, password, database, table_name, sort_by, order, port=port)
+    return await asyncio.to_thread(get_sorted_rows, host, user, password, database, table_name, sort_by, order, port, columnar)
 
 @mcp.tool()
-def mysql_get_limited_rows(host: str, user: str, password: str, database: str, table_name: str, limit: int, offset: int = 0, port: int = 3306)  -> Optional[List[Dict]]:
+async def mysql_get_limited_rows(host: str, user: str, password: str, database: str, table_name: str, limit: int, offset: int = 0, port: int = 3306, columnar: bool = False)  -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Retrieves a limited number of rows from the specified table.
 
@@ -133,14 +217,57 @@ def mysql_get_limited_rows(host: str, user: str, password: str, database: str, t
         limit (int): The number of rows to fetch.
         offset (int): The starting point for fetching rows. Default is 0.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
 
     Returns:
-        Optional[List[Dict]]: Limited rows as a list of dictionaries, or None on error.
+        Optional[Union[List[Dict], Dict[str, list]]]: Limited rows as a list of dictionaries (or in columnar shape), or None on error.
     """
-    return get_limited_rows(host, user, password, database, table_name, limit, offset, port=port)
+    return await asyncio.to_thread(get_limited_rows, host, user, password, database, table_name, limit, offset, port, columnar)
 
 @mcp.tool()
-def mysql_get_distinct_values(host: str, user: str, password: str, database: str, table_name: str, column: str, port: int = 3306) -> Optional[List[Any]]:
+async def mysql_get_page_after(host: str, user: str, password: str, database: str, table_name: str, limit: int, after_value: Any = None, pk_column: Optional[str] = None, port: int = 3306) -> Optional[Dict[str, Any]]:
+    """
+    Retrieves the next page of rows in primary key order; prefer this over offsets for deep pagination.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table name.
+        limit (int): The number of rows to fetch.
+        after_value (Any): The last_value returned for the previous page. Omit for the first page.
+        pk_column (Optional[str]): A unique, indexed column to page by. Defaults to the primary key.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[Dict[str, Any]]: {"rows": [...], "last_value": ...}; last_value is None after the last page.
+    """
+    return await asyncio.to_thread(get_page_after, host, user, password, database, table_name, limit, after_value, pk_column, port)
+
+@mcp.tool()
+async def mysql_stream_rows(host: str, user: str, password: str, database: str, table_name: str, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None, port: int = 3306) -> Optional[str]:
+    """
+    Streams rows from the specified table as newline-delimited JSON, up to the server's DBMCP_MAX_ROWS cap.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table name.
+        filters (Optional[Dict[str, Any]]): Column names mapped to the values they must equal.
+        limit (Optional[int]): The maximum number of rows to return, at most DBMCP_MAX_ROWS.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[str]: One JSON object per line, or None on error.
+    """
+    return await asyncio.to_thread(stream_rows, host, user, password, database, table_name, filters, limit, port)
+
+@mcp.tool()
+async def mysql_get_distinct_values(host: str, user: str, password: str, database: str, table_name: str, column: str, port: int = 3306) -> Optional[List[Any]]:
     """
     Retrieves distinct values from a specific column in the given table.
 
@@ -156,10 +283,10 @@ def mysql_get_distinct_values(host: str, user: str, password: str, database: str
     Returns:
         Optional[List[Any]]: A list of distinct values or None on error.
     """
-    return get_distinct_values(host, user, password, database, table_name, column, port=port)
+    return await asyncio.to_thread(get_distinct_values, host, user, password, database, table_name, column, port)
 
 @mcp.tool()
-def mysql_get_aggregated_data(host: str, user: str, password: str, database: str, table_name: str, aggregation: str, column: str, port: int = 3306) -> Optional[Any]:
+async def mysql_get_aggregated_data(host: str, user: str, password: str, database: str, table_name: str, aggregation: str, column: str, port: int = 3306) -> Optional[Any]:
     """
     Retrieves aggregated data from a specified column in the given table.
 
@@ -171,10 +298,10 @@ def mysql_get_aggregated_data(host: str, user: str, password: str, database: str
     Returns:
         Optional[Any]: The result of the aggregation or None on error.
     """
-    return get_aggregated_data(host, user, password, database, table_name, aggregation, column, port=port)
+    return await asyncio.to_thread(get_aggregated_data, host, user, password, database, table_name, aggregation, column, port)
 
 @mcp.tool()
-def mysql_get_grouped_data(host: str, user: str, password: str, database: str, table_name: str, group_by: str, aggregation: str, column: str, port: int = 3306) -> Optional[Dict[str, Any]]:
+async def mysql_get_grouped_data(host: str, user: str, password: str, database: str, table_name: str, group_by: str, aggregation: str, column: str, port: int = 3306) -> Optional[Dict[str, Any]]:
     """
     Groups data by a specified column and applies an aggregation function.
 
@@ -193,10 +320,10 @@ def mysql_get_grouped_data(host: str, user: str, password: str, database: str, t
         Optional[Dict[str, Any]]: A dictionary where keys are group values and values are aggregated data,
         or None if an error occurs.
     """
-    return get_grouped_data(host, user, password, database, table_name, group_by, aggregation, column, port=port)
+    return await asyncio.to_thread(get_grouped_data, host, user, password, database, table_name, group_by, aggregation, column, port)
 
 @mcp.tool()
-def mysql_create_table(host:str, user:str, password:str, database:str, table_name:str, columns: Dict[str, str], options: Optional[Dict[str, str]] = None, port: int = 3306) -> bool:
+async def mysql_create_table(host:str, user:str, password:str, database:str, table_name:str, columns: Dict[str, str], options: Optional[Dict[str, str]] = None, port: int = 3306) -> bool:
     """
     Creates a table with the specified columns and options.
     Args:
@@ -211,10 +338,10 @@ def mysql_create_table(host:str, user:str, password:str, database:str, table_nam
     Returns:
         bool: True if the table was created successfully, False otherwise.
     """
-    return create_table(host, user, password, database, table_name, columns, options, port=port)
+    return await asyncio.to_thread(create_table, host, user, password, database, table_name, columns, options, port)
 
 @mcp.tool()
-def mysql_drop_table(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> bool:
+async def mysql_drop_table(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> bool:
     """
     Drops the specified table.
     Args:
@@ -227,10 +354,10 @@ def mysql_drop_table(host: str, user: str, password: str, database: str, table_n
     Returns:
         bool: True if the table was dropped successfully, False otherwise.
     """
-    return drop_table(host, user, password, database, table_name, port=port)
+    return await asyncio.to_thread(drop_table, host, user, password, database, table_name, port)
 
 @mcp.tool()
-def mysql_show_indexes(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Optional[List[Dict[str, str]]]:
+async def mysql_show_indexes(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Optional[List[Dict[str, str]]]:
     """
     Retrieves all indexes from a given table.
     Args:
@@ -241,12 +368,13 @@ def mysql_show_indexes(host: str, user: str, password: str, database: str, table
         table_name (str): The name of the table to retrieve indexes from.
         port (int): The port number for the MySQL server.
     Returns:
-        Optional[List[Dict[str, str]]]: A list of dictionaries containing index information, or None if an error occurs.
+        Optional[List[Dict[str, str]]]: One dictionary per indexed column (INDEX_NAME, COLUMN_NAME, NON_UNIQUE,
+        SEQ_IN_INDEX, INDEX_TYPE), or None if an error occurs.
     """
-    return show_indexes(host, user, password, database, table_name, port=port)
+    return await asyncio.to_thread(show_indexes, host, user, password, database, table_name, port)
 
 @mcp.tool()
-def mysql_create_index(host: str, user: str, password: str, database: str, table_name: str, index_name: str, columns: List[str], unique: bool = False, port: int = 3306) -> bool:
+async def mysql_create_index(host: str, user: str, password: str, database: str, table_name: str, index_name: str, columns: List[str], unique: bool = False, port: int = 3306) -> bool:
     """
     Creates an index on the specified columns of a table.
     Args:
@@ -262,10 +390,29 @@ def mysql_create_index(host: str, user: str, password: str, database: str, table
     Returns:
         bool: True if the index was created successfully, False otherwise.
     """
-    return create_index(host, user, password, database, table_name, index_name, columns, unique, port=port)
+    return await asyncio.to_thread(create_index, host, user, password, database, table_name, index_name, columns, unique, port)
 
 @mcp.tool()
-def mysql_insert_row(host:str, user:str, password:str, database:str, table_name:str, data:Dict[str, Any], port: int = 3306) -> bool :
+async def mysql_create_indexes(host: str, user: str, password: str, database: str, table_name: str, specs: List[Tuple[str, List[str], bool]], port: int = 3306) -> bool:
+    """
+    Creates several indexes on a table in one ALTER TABLE statement, scanning the table only once.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table to create the indexes on.
+        specs (List[Tuple[str, List[str], bool]]): One [index_name, columns, unique] entry per index.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        bool: True if all indexes were created successfully, False otherwise.
+    """
+    return await asyncio.to_thread(create_indexes, host, user, password, database, table_name, specs, port)
+
+@mcp.tool()
+async def mysql_insert_row(host:str, user:str, password:str, database:str, table_name:str, data:Dict[str, Any], port: int = 3306) -> bool :
     """
     Inserts a single row into the specified table.
 
@@ -281,10 +428,10 @@ def mysql_insert_row(host:str, user:str, password:str, database:str, table_name:
     Returns:
         bool: True if the insertion was successful, False otherwise.
     """
-    return insert_row(host, user, password, database, table_name, data, port=port)
+    return await asyncio.to_thread(insert_row, host, user, password, database, table_name, data, port)
 
 @mcp.tool()
-def mysql_insert_multiple_rows(host: str, user: str, password: str, database: str, table_name: str, data: List[Dict[str, Any]], port: int = 3306) -> bool:
+async def mysql_insert_multiple_rows(host: str, user: str, password: str, database: str, table_name: str, data: List[Dict[str, Any]], port: int = 3306) -> bool:
     """
     Inserts multiple rows into the specified table.
 
@@ -300,10 +447,10 @@ def mysql_insert_multiple_rows(host: str, user: str, password: str, database: st
     Returns:
         bool: True if the insertion was successful, False otherwise.
     """
-    return insert_multiple_rows(host, user, password, database, table_name, data, port=port)
+    return await asyncio.to_thread(insert_multiple_rows, host, user, password, database, table_name, data, port)
 
 @mcp.tool()
-def mysql_delete_rows(host: str, user: str, password: str, database: str, table_name: str, conditions: Dict[str, Any], port: int = 3306) -> bool:
+async def mysql_delete_rows(host: str, user: str, password: str, database: str, table_name: str, conditions: Dict[str, Any], port: int = 3306) -> bool:
     """
     Deletes rows from the specified table based on conditions.
 
@@ -319,10 +466,10 @@ def mysql_delete_rows(host: str, user: str, password: str, database: str, table_
     Returns:
         bool: True if the deletion was successful, False otherwise.
     """
-    return delete_rows(host, user, password, database, table_name, conditions, port=port)
+    return await asyncio.to_thread(delete_rows, host, user, password, database, table_name, conditions, port)
 
 @mcp.tool()
-def mysql_update_rows(host: str, user: str, password: str, database: str, table_name: str, data: Dict[str, Any], conditions: Dict[str, Any], port: int = 3306) -> bool:
+async def mysql_update_rows(host: str, user: str, password: str, database: str, table_name: str, data: Dict[str, Any], conditions: Dict[str, Any], port: int = 3306) -> bool:
     """
     Updates rows in the specified table based on conditions.
 
@@ -339,10 +486,10 @@ def mysql_update_rows(host: str, user: str, password: str, database: str, table_
     Returns:
         bool: True if the update was successful, False otherwise.
     """
-    return update_rows(host, user, password, database, table_name, data, conditions, port=port)
+    return await asyncio.to_thread(update_rows, host, user, password, database, table_name, data, conditions, port)
 
 @mcp.tool()
-def mysql_execute_custom_query(host: str, user: str, password: str, database: str, query: str, port: int = 3306) -> Optional[List[Dict]]:
+async def mysql_execute_custom_query(host: str, user: str, password: str, database: str, query: str, port: int = 3306, columnar: bool = False) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Executes a custom SQL query and returns the result as a list of dictionaries. Only use this if necessary like for complex queries. Reply on built in methods to execute queries.
 
@@ -353,8 +500,11 @@ def mysql_execute_custom_query(host: str, user: str, password: str, database: st
         database (str): The database name.
         query (str): The SQL query to execute.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with the column names listed once
+            instead of one dictionary per row, which is much more compact for large results.
 
     Returns:
-        Optional[List[Dict]]: The result of the query as a list of dictionaries, or None if an error occurs.
+        Optional[Union[List[Dict], Dict[str, list]]]: The result of the query as a list of dictionaries (or in columnar shape),
+        or None if an error occurs.
     """
-    return execute_custom_query(host, user, password, database, query, port=port)
\ No newline at end of file
+    return await asyncio.to_thread(execute_custom_query, host, user, password, database, query, port, columnar)
\ No newline at end of file
@@ -0,0 +1,84 @@
+from mysqldb.services import ddl, dml, pipeline, reads, schema
+
+from typing import Any, Awaitable, Callable, Dict, List
+
+import asyncio
+import functools
+
+def to_async(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wraps a blocking service function into a coroutine function that runs it on a worker thread.
+
+    Every call borrows its own pooled connection, so awaiting several calls together (e.g. with
+    asyncio.gather) runs them concurrently on up to DBMCP_POOL_SIZE connections per database.
+
+    Args:
+        func (Callable[..., Any]): The synchronous service function.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: A coroutine function with the same arguments and result.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+async def for_each_table(func: Callable[..., Any], host: str, user: str, password: str, database: str, tables: List[str], *args: Any, port: int = 3306) -> Dict[str, Any]:
+    """
+    Runs a per-table service function for many tables concurrently.
+
+    Args:
+        func (Callable[..., Any]): A synchronous service function taking (host, user, password, database, table_name, ...).
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        tables (List[str]): The tables to run the function for.
+        *args (Any): Further positional arguments passed after the table name.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Dict[str, Any]: Each table name mapped to the function's result for it.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(func, host, user, password, database, table, *args, port=port) for table in tables)
+    )
+    return dict(zip(tables, results))
+
+# Schema
+get_tables = to_async(schema.get_tables)
+get_schema = to_async(schema.get_schema)
+get_table_description = to_async(schema.get_table_description)
+get_table_descriptions = to_async(schema.get_table_descriptions)
+
+# DDL
+create_table = to_async(ddl.create_table)
+drop_table = to_async(ddl.drop_table)
+show_indexes = to_async(ddl.show_indexes)
+create_index = to_async(ddl.create_index)
+create_indexes = to_async(ddl.create_indexes)
+
+# DML
+insert_row = to_async(dml.insert_row)
+insert_multiple_rows = to_async(dml.insert_multiple_rows)
+update_rows = to_async(dml.update_rows)
+delete_rows = to_async(dml.delete_rows)
+
+# Reads
+get_all_rows = to_async(reads.get_all_rows)
+get_rows = to_async(reads.get_rows)
+get_rows_in = to_async(reads.get_rows_in)
+get_rows_by_key = to_async(reads.get_rows_by_key)
+get_filtered_rows = to_async(reads.get_filtered_rows)
+get_sorted_rows = to_async(reads.get_sorted_rows)
+get_limited_rows = to_async(reads.get_limited_rows)
+get_page_after = to_async(reads.get_page_after)
+get_distinct_values = to_async(reads.get_distinct_values)
+get_aggregated_data = to_async(reads.get_aggregated_data)
+get_grouped_data = to_async(reads.get_grouped_data)
+execute_custom_query = to_async(reads.execute_custom_query)
+stream_rows = to_async(reads.stream_rows)
+
+# Pipelines
+execute_pipeline = to_async(pipeline.execute_pipeline)
+run_batch = to_async(pipeline.run_batch)
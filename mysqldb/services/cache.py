@@ -0,0 +1,86 @@
+from config.logger_config import LoggerFactory
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+import functools
+import inspect
+import os
+import threading
+import time
+
+logger = LoggerFactory.get_logger(__name__)
+
+# Seconds a cached metadata result stays valid; 0 disables the cache
+SCHEMA_CACHE_TTL = float(os.getenv("DBMCP_SCHEMA_CACHE_TTL", "60"))
+
+# Maximum number of cached metadata results across all databases
+SCHEMA_CACHE_SIZE = int(os.getenv("DBMCP_SCHEMA_CACHE_SIZE", "1024"))
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Results by (host, database, function, arguments), each paired with its expiry time
+_entries: 'OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]' = OrderedDict()
+_lock = threading.RLock()
+
+def _freeze(value: Any) -> Hashable:
+    return tuple(value) if isinstance(value, list) else value
+
+def memoize_ttl(func: F) -> F:
+    """
+    Caches a metadata service function's results for DBMCP_SCHEMA_CACHE_TTL seconds.
+
+    The function must take host and database arguments. Every argument, credentials included, is
+    part of the key, so callers only see results fetched with their own credentials. None results
+    signal a failure and are never cached. Cached results are shared; callers must not mutate them.
+
+    Args:
+        func (Callable[..., Any]): The function to cache.
+
+    Returns:
+        Callable[..., Any]: The caching wrapper.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if SCHEMA_CACHE_TTL <= 0:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        key = (arguments["host"], arguments["database"], func.__qualname__, *(_freeze(value) for value in arguments.values()))
+
+        now = time.monotonic()
+        with _lock:
+            entry = _entries.get(key)
+            if entry is not None and entry[0] > now:
+                _entries.move_to_end(key)
+                return entry[1]
+
+        result = func(*args, **kwargs)
+        if result is not None:
+            with _lock:
+                _entries[key] = (now + SCHEMA_CACHE_TTL, result)
+                _entries.move_to_end(key)
+                while len(_entries) > SCHEMA_CACHE_SIZE:
+                    _entries.popitem(last=False)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+def invalidate_schema_cache(host: str, database: str) -> None:
+    """
+    Drops every cached metadata result for a database, e.g. after its tables were changed.
+
+    Args:
+        host (str): The host address of the MySQL server.
+        database (str): The name of the database.
+    """
+    with _lock:
+        stale = [key for key in _entries if key[0] == host and key[1] == database]
+        for key in stale:
+            del _entries[key]
+    if stale:
+        logger.debug("Invalidated %d cached schema results for database '%s'", len(stale), database)
@@ -1,13 +1,23 @@
-from mysqldb.services.connection import connect_to_mysql
+from mysqldb.services.pool import get_pool
+from mysqldb.services.sql import quote_ident
+from mysqldb.services.cache import invalidate_schema_cache
 from config.logger_config import LoggerFactory
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Tuple
 from mysql.connector import Error, MySQLConnection
 from mysql.connector.cursor import MySQLCursor
 
 logger = LoggerFactory.get_logger(__name__)
 
-def create_table(host:str, user:str, password:str, database:str, table_name:str, columns: Dict[str, str], options: Optional[Dict[str, str]] = None) -> bool:
+# Unlike SHOW INDEX, this takes the schema and table as bound parameters
+_INDEXES_QUERY = (
+    "SELECT INDEX_NAME, COLUMN_NAME, NON_UNIQUE, SEQ_IN_INDEX, INDEX_TYPE "
+    "FROM information_schema.statistics "
+    "WHERE table_schema = %s AND table_name = %s "
+    "ORDER BY INDEX_NAME, SEQ_IN_INDEX"
+)
+
+def create_table(host:str, user:str, password:str, database:str, table_name:str, columns: Dict[str, str], options: Optional[Dict[str, str]] = None, port: int = 3306) -> bool:
     """
     Creates a table with the specified columns and options.
     Args:
@@ -18,32 +28,38 @@ def create_table(host:str, user:str, password:str, database:str, table_name:str,
         table_name (str): The name of the table to create.
         columns (Dict[str, str]): A dictionary of column names and their data types.
         options (Optional[Dict[str, str]]): Additional options like PRIMARY KEY, AUTO_INCREMENT, UNIQUE, NOT NULL.
+        port (int): The port number for the MySQL server.
     Returns:
         bool: True if the table was created successfully, False otherwise.
     """
+    connection = None
+    cursor = None
     try:
-        connection : MySQLConnection = connect_to_mysql(host=host, user=user, password=password,database=database)
-        cursor : MySQLCursor = connection.cursor(dictionary=True)
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
+        cursor: MySQLCursor = connection.cursor()
         column_definitions = []
         for column_name, column_type in columns.items():
-            definition = f"{column_name} {column_type}"
+            definition = f"{quote_ident(column_name)} {column_type}"
             if options and options.get(column_name) is not None:
                 definition += f" {options.get(column_name)}"
             column_definitions.append(definition)
 
-        query = f"CREATE TABLE {table_name} ({', '.join(column_definitions)})"
-        logger.debug(f"Executing query: \n{query}")
+        query = f"CREATE TABLE {quote_ident(table_name)} ({', '.join(column_definitions)})"
+        logger.debug("Executing query: \n%s", query)
         cursor.execute(query)
-        connection.commit()
-        cursor.close()
-        connection.close()
-        logger.info(f"Table '{table_name}' created successfully.")
+        invalidate_schema_cache(host, database)
+        logger.info("Table '%s' created successfully.", table_name)
         return True
     except Error as e:
-        logger.error(f"Error creating table '{table_name}': {e}")
+        logger.error("Error creating table '%s': %s", table_name, e)
         return False
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
-def drop_table(host: str, user: str, password: str, database: str, table_name: str) -> bool:
+def drop_table(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> bool:
     """
     Drops the specified table.
     Args:
@@ -52,25 +68,31 @@ def drop_table(host: str, user: str, password: str, database: str, table_name: s
         password (str): The database password.
         database (str): The database name.
         table_name (str): The name of the table to drop.
+        port (int): The port number for the MySQL server.
     Returns:
         bool: True if the table was dropped successfully, False otherwise.
     """
+    connection = None
+    cursor = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
         cursor: MySQLCursor = connection.cursor()
-        query = f"DROP TABLE IF EXISTS {table_name}"
-        logger.debug(f"Executing query: \n{query}")
+        query = f"DROP TABLE IF EXISTS {quote_ident(table_name)}"
+        logger.debug("Executing query: \n%s", query)
         cursor.execute(query)
-        connection.commit()
-        cursor.close()
-        connection.close()
-        logger.info(f"Table '{table_name}' dropped successfully.")
+        invalidate_schema_cache(host, database)
+        logger.info("Table '%s' dropped successfully.", table_name)
         return True
     except Error as e:
-        logger.error(f"Error dropping table '{table_name}': {e}")
+        logger.error("Error dropping table '%s': %s", table_name, e)
         return False
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
 
-def show_indexes(host: str, user: str, password: str, database: str, table_name: str) -> Optional[List[Dict[str, str]]]:
+def show_indexes(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Optional[List[Dict[str, str]]]:
     """
     Retrieves all indexes from a given table.
     Args:
@@ -79,52 +101,81 @@ def show_indexes(host: str, user: str, password: str, database: str, table_name:
         password (str): The database password.
         database (str): The database name.
         table_name (str): The name of the table to retrieve indexes from.
+        port (int): The port number for the MySQL server.
     Returns:
-        Optional[List[Dict[str, str]]]: A list of dictionaries containing index information, or None if an error occurs.
+        Optional[List[Dict[str, str]]]: One dictionary per indexed column with INDEX_NAME, COLUMN_NAME, NON_UNIQUE,
+        SEQ_IN_INDEX and INDEX_TYPE, ordered by index and column position, or None if an error occurs.
     """
+    connection = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
 
-        query = f"SHOW INDEX FROM {table_name}"
-        logger.debug(f"Executing query: \n{query}")
-        cursor.execute(query)
-        indexes = cursor.fetchall()
-        logger.info(f"Indexes retrieved from table '{table_name}': {indexes}")
-        cursor.close()
-        connection.close()
+        logger.debug("Executing query: \n%s", _INDEXES_QUERY)
+        with connection.cursor(dictionary=True) as cursor:
+            cursor.execute(_INDEXES_QUERY, (database, table_name))
+            indexes = cursor.fetchall()
+        logger.info("Indexes retrieved from table '%s': %s", table_name, indexes)
         return indexes
     except Error as e:
-        logger.error(f"Error retrieving indexes from table '{table_name}': {e}")
+        logger.error("Error retrieving indexes from table '%s': %s", table_name, e)
         return None
+    finally:
+        if connection:
+            connection.close()
 
-def create_index(host: str, user: str, password: str, database: str, table_name: str, index_name: str, columns: List[str], unique: bool = False) -> bool:
+def create_indexes(host: str, user: str, password: str, database: str, table_name: str, specs: List[Tuple[str, List[str], bool]], port: int = 3306) -> bool:
     """
-    Creates an index on the specified columns of a table.
+    Creates several indexes on a table with a single ALTER TABLE statement, so the table is scanned once.
     Args:
         host (str): The database host.
         user (str): The database user.
         password (str): The database password.
         database (str): The database name.
-        table_name (str): The table to create the index on.
-        index_name (str): The name of the index.
-        columns (List[str]): A list of column names to be indexed.
-        unique (bool): If True, creates a UNIQUE index. Defaults to False.
+        table_name (str): The table to create the indexes on.
+        specs (List[Tuple[str, List[str], bool]]): One (index_name, columns, unique) entry per index.
+        port (int): The port number for the MySQL server.
     Returns:
-        bool: True if the index was created successfully, False otherwise.
+        bool: True if all indexes were created successfully, False otherwise.
     """
+    connection = None
+    cursor = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
         cursor: MySQLCursor = connection.cursor()
 
-        index_type = "UNIQUE" if unique else ""
-        query = f"CREATE {index_type} INDEX {index_name} ON {table_name} ({', '.join(columns)})"
+        clauses = [
+            f"ADD {'UNIQUE ' if unique else ''}INDEX {quote_ident(index_name)} ({', '.join(map(quote_ident, columns))})"
+            for index_name, columns, unique in specs
+        ]
+        query = f"ALTER TABLE {quote_ident(table_name)} {', '.join(clauses)}"
+        logger.debug("Executing query: \n%s", query)
         cursor.execute(query)
-        connection.commit()
-        cursor.close()
-        connection.close()
-        logger.info(f"Index '{index_name}' created successfully on table '{table_name}'.")
+        invalidate_schema_cache(host, database)
+        logger.info("Indexes %s created successfully on table '%s'.", [spec[0] for spec in specs], table_name)
         return True
     except Error as e:
-        logger.error(f"Error creating index '{index_name}': {e}")
+        logger.error("Error creating indexes on table '%s': %s", table_name, e)
         return False
+    finally:
+        if cursor:
+            cursor.close()
+        if connection:
+            connection.close()
+
+def create_index(host: str, user: str, password: str, database: str, table_name: str, index_name: str, columns: List[str], unique: bool = False, port: int = 3306) -> bool:
+    """
+    Creates an index on the specified columns of a table.
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table to create the index on.
+        index_name (str): The name of the index.
+        columns (List[str]): A list of column names to be indexed.
+        unique (bool): If True, creates a UNIQUE index. Defaults to False.
+        port (int): The port number for the MySQL server.
+    Returns:
+        bool: True if the index was created successfully, False otherwise.
+    """
+    return create_indexes(host, user, password, database, table_name, [(index_name, columns, unique)], port)
@@ -1,14 +1,331 @@
 from config.logger_config import LoggerFactory
-from mysqldb.services.connection import connect_to_mysql
+from mysqldb.services.pool import get_pool, local_infile_dir
+from mysqldb.services.sql import is_identifier, quote_ident
 
-from typing import Dict, List, Any
-from mysql.connector.cursor import MySQLCursor
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
+from concurrent.futures import Future
 from mysql.connector.connection import MySQLConnection
-from mysql.connector import Error
+from mysql.connector import DatabaseError, Error, errorcode
+
+import atexit
+import functools
+import itertools
+import operator
+import os
+import queue
+import tempfile
+import threading
+import time
 
 logger = LoggerFactory.get_logger(__name__)
 
-def insert_row(host:str, user:str, password:str, database:str, table_name:str, data:Dict[str, Any]) -> bool :
+# A multi-row INSERT is sent once either limit is reached; max_allowed_packet may lower the byte limit further
+INSERT_CHUNK_ROWS = 1000
+INSERT_CHUNK_BYTES = 4 * 1024 * 1024
+
+def _chunk_rows(rows: Iterable[Iterable[Any]], max_bytes: int) -> Iterator[List[Iterable[Any]]]:
+    """
+    Groups rows into batches that each fit into a single multi-row INSERT.
+
+    Args:
+        rows (Iterable[Iterable[Any]]): The rows of values to insert.
+        max_bytes (int): The estimated formatted size a batch may not exceed.
+
+    Yields:
+        List[Iterable[Any]]: At most INSERT_CHUNK_ROWS rows totalling at most max_bytes, or a single larger row.
+    """
+    chunk: List[Iterable[Any]] = []
+    size = 0
+    for row in rows:
+        row_size = len(repr(row)) + 4
+        if chunk and (len(chunk) >= INSERT_CHUNK_ROWS or size + row_size > max_bytes):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk
+
+@functools.lru_cache(maxsize=1024)
+def _insert_template(table_name: str, columns: Tuple[str, ...]) -> str:
+    """
+    Builds the single-row INSERT statement for a table and column list, memoized per shape.
+
+    Args:
+        table_name (str): The name of the table to insert into.
+        columns (Tuple[str, ...]): The column names, in the order their values are bound.
+
+    Returns:
+        str: The parameterized SQL text.
+    """
+    values = ', '.join(['%s'] * len(columns))
+    return f"INSERT INTO {quote_ident(table_name)} ({','.join(map(quote_ident, columns))}) VALUES ({values})"
+
+@functools.lru_cache(maxsize=1024)
+def _where_clause(columns: Tuple[str, ...]) -> str:
+    """
+    Builds an equality WHERE clause body for the given columns, memoized per column list.
+
+    Args:
+        columns (Tuple[str, ...]): The columns compared against %s placeholders, joined with AND.
+
+    Returns:
+        str: The clause without the WHERE keyword.
+    """
+    return ' AND '.join([f"{quote_ident(k)} = %s" for k in columns])
+
+@functools.lru_cache(maxsize=1024)
+def _update_template(table_name: str, set_columns: Tuple[str, ...], where_columns: Tuple[str, ...]) -> str:
+    """
+    Builds an UPDATE statement for a table, assigned columns and condition columns, memoized per shape.
+
+    Args:
+        table_name (str): The name of the table to update.
+        set_columns (Tuple[str, ...]): The columns assigned new values.
+        where_columns (Tuple[str, ...]): The columns the rows are matched on.
+
+    Returns:
+        str: The parameterized SQL text.
+    """
+    set_clause = ', '.join([f"{quote_ident(k)} = %s" for k in set_columns])
+    return f"UPDATE {quote_ident(table_name)} SET {set_clause} WHERE {_where_clause(where_columns)}"
+
+def _row_values(columns: Tuple[str, ...]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """
+    Returns a function that reads a row's values in the order of columns, whatever the row's key order.
+
+    Args:
+        columns (Tuple[str, ...]): The column names, in the order their values are bound.
+
+    Returns:
+        Callable[[Dict[str, Any]], Tuple[Any, ...]]: Maps a row dictionary to a tuple of its values.
+    """
+    if len(columns) == 1:
+        # itemgetter with a single key returns the bare value rather than a 1-tuple
+        column = columns[0]
+        return lambda row: (row[column],)
+    return operator.itemgetter(*columns)
+
+def _insert_rows(connection: MySQLConnection, table_name: str, columns: Tuple[str, ...], rows: Iterable[Iterable[Any]]) -> None:
+    """
+    Inserts rows as chunked multi-row INSERT statements within a single transaction.
+
+    Args:
+        connection (MySQLConnection): A pooled connection; autocommit is turned off for this borrow.
+        table_name (str): The name of the table to insert into.
+        columns (Tuple[str, ...]): The column names, in the order of the values in each row.
+        rows (Iterable[Iterable[Any]]): The rows of values to insert.
+
+    Raises:
+        Error: If any chunk fails; the transaction is rolled back first.
+    """
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    prefix = f"INSERT INTO {quote_ident(table_name)} ({', '.join(map(quote_ident, columns))}) VALUES "
+
+    # Leave half of max_allowed_packet as headroom for escaping and the statement text
+    max_bytes = min(INSERT_CHUNK_BYTES, connection.max_allowed_packet() // 2)
+
+    # Each chunk is sent as one INSERT ... VALUES (...), (...) statement; one transaction avoids a commit per chunk
+    connection.disable_autocommit()
+    try:
+        with connection.cursor() as cursor:
+            for chunk in _chunk_rows(rows, max_bytes):
+                query = prefix + ", ".join([placeholders] * len(chunk))
+                cursor.execute(query, list(itertools.chain.from_iterable(chunk)))
+        connection.commit()
+    except Error:
+        connection.rollback()
+        raise
+
+# Bulk inserts of at least this many rows are loaded with LOAD DATA LOCAL INFILE instead of INSERT statements
+LOAD_DATA_THRESHOLD = int(os.getenv("DBMCP_LOAD_DATA_THRESHOLD", "10000"))
+
+# Errors meaning local infile is disabled on the server or client, in which case INSERT is used instead
+_LOCAL_INFILE_DISABLED = {
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+    errorcode.CR_LOAD_DATA_LOCAL_INFILE_REJECTED,
+}
+
+def _tsv_field(value: Any) -> bytes:
+    """
+    Encodes a value as a LOAD DATA field using the default escaping (ESCAPED BY '\\\\').
+    """
+    if value is None:
+        return b"\\N"
+    if isinstance(value, bool):
+        value = int(value)
+    raw = bytes(value) if isinstance(value, (bytes, bytearray)) else str(value).encode("utf-8")
+    return (raw.replace(b"\\", b"\\\\").replace(b"\t", b"\\t").replace(b"\n", b"\\n")
+            .replace(b"\r", b"\\r").replace(b"\0", b"\\0"))
+
+def _load_rows(connection: MySQLConnection, table_name: str, columns: Tuple[str, ...], rows: Iterable[Iterable[Any]]) -> None:
+    """
+    Loads rows with a single LOAD DATA LOCAL INFILE statement within one transaction.
+
+    The rows are written as tab-separated values to a temporary file in local_infile_dir(), the only
+    directory pooled connections may send to the server; the file is removed afterwards.
+
+    LOCAL loads skip duplicate keys and coerce bad values with a warning instead of failing, so any
+    warning rolls the load back. Bulk inserts then fail the same way whether they go through INSERT or here.
+
+    Args:
+        connection (MySQLConnection): A pooled connection; autocommit is turned off for this borrow.
+        table_name (str): The name of the table to load into.
+        columns (Tuple[str, ...]): The column names, in the order of the values in each row.
+        rows (Iterable[Iterable[Any]]): The rows of values to load.
+
+    Raises:
+        Error: If the load fails or produces warnings; the transaction is rolled back first.
+    """
+    query = (
+        f"LOAD DATA LOCAL INFILE %s INTO TABLE {quote_ident(table_name)} CHARACTER SET utf8mb4 "
+        f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(map(quote_ident, columns))})"
+    )
+    with tempfile.NamedTemporaryFile("wb", dir=local_infile_dir(), suffix=".tsv") as infile:
+        for row in rows:
+            infile.write(b"\t".join(map(_tsv_field, row)) + b"\n")
+        infile.flush()
+
+        connection.disable_autocommit()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (infile.name,))
+                warnings = cursor.warning_count
+                if warnings:
+                    cursor.execute("SHOW WARNINGS LIMIT 3")
+                    details = "; ".join(str(message) for _, _, message in cursor.fetchall())
+                    raise DatabaseError(msg=f"LOAD DATA produced {warnings} warnings: {details}")
+            connection.commit()
+        except Error:
+            connection.rollback()
+            raise
+
+# Buffered single-row inserts are flushed after this many milliseconds or rows, whichever comes first
+ASYNC_INSERT_WAIT_MS = float(os.getenv("DBMCP_ASYNC_INSERT_WAIT_MS", "200"))
+ASYNC_INSERT_MAX_ROWS = int(os.getenv("DBMCP_ASYNC_INSERT_MAX_ROWS", "100000"))
+
+class AsyncInsertBuffer:
+    """
+    Coalesces single-row inserts into multi-row INSERT statements on a background thread.
+
+    Rows are grouped by connection parameters, table and column list. A group is written as one
+    transaction, so every row in it succeeds or fails together.
+    """
+
+    def __init__(self, wait_time_ms: float = ASYNC_INSERT_WAIT_MS, max_rows: int = ASYNC_INSERT_MAX_ROWS):
+        self.wait_time = wait_time_ms / 1000
+        self.max_rows = max_rows
+        self._queue: 'queue.Queue[Optional[Tuple[tuple, Tuple[Any, ...], Future]]]' = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, host: str, user: str, password: str, database: str, table_name: str, data: Dict[str, Any], port: int = 3306) -> 'Future[bool]':
+        """
+        Queues a row for insertion and returns without waiting for the database.
+
+        Args:
+            host (str): The database host.
+            user (str): The database user.
+            password (str): The database password.
+            database (str): The database name.
+            table_name (str): The name of the table to insert into.
+            data (Dict[str, Any]): A dictionary containing column names and their values.
+            port (int): The port number for the MySQL server.
+
+        Returns:
+            Future[bool]: Resolves to True once the row's batch is committed, or False if the database
+            rejected it. Unexpected errors, e.g. values the driver cannot encode, are set on the future.
+        """
+        future: 'Future[bool]' = Future()
+        key = (host, user, password, database, port, table_name, tuple(data))
+        self._ensure_worker()
+        self._queue.put((key, tuple(data.values()), future))
+        return future
+
+    def close(self) -> None:
+        """
+        Flushes every queued row and stops the worker thread.
+        """
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='async-insert', daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        try:
+            stopping = False
+            while not stopping:
+                item = self._queue.get()
+                if item is None:
+                    return
+
+                # Keep collecting until the window closes or the batch is full
+                batches: Dict[tuple, List[Tuple[Tuple[Any, ...], Future]]] = {}
+                try:
+                    count = 0
+                    deadline = time.monotonic() + self.wait_time
+                    while item is not None:
+                        key, row, future = item
+                        batches.setdefault(key, []).append((row, future))
+                        count += 1
+                        remaining = deadline - time.monotonic()
+                        if count >= self.max_rows or remaining <= 0:
+                            break
+                        try:
+                            item = self._queue.get(timeout=remaining)
+                        except queue.Empty:
+                            break
+                        stopping = item is None
+
+                    for key, entries in batches.items():
+                        self._flush(key, entries)
+                except Exception as e:
+                    # One bad batch must not take the worker down and leave later submitters waiting forever
+                    logger.exception("Unexpected error in async insert worker: %s", e)
+                    for entries in batches.values():
+                        for _, future in entries:
+                            if not future.done():
+                                future.set_exception(e)
+        finally:
+            with self._lock:
+                if self._worker is threading.current_thread():
+                    self._worker = None
+
+    @staticmethod
+    def _flush(key: tuple, entries: List[Tuple[Tuple[Any, ...], Future]]) -> None:
+        host, user, password, database, port, table_name, columns = key
+        connection = None
+        try:
+            connection = get_pool(host, user, password, database, port).get_connection()
+            _insert_rows(connection, table_name, columns, (row for row, _ in entries))
+            logger.info("%s buffered rows inserted into table '%s'.", len(entries), table_name)
+            success = True
+        except Error as e:
+            logger.error("Error inserting buffered rows into table '%s': %s", table_name, e)
+            success = False
+        except Exception as e:
+            logger.exception("Unexpected error inserting buffered rows into table '%s': %s", table_name, e)
+            for _, future in entries:
+                future.set_exception(e)
+            return
+        finally:
+            if connection:
+                connection.close()
+        for _, future in entries:
+            future.set_result(success)
+
+_async_insert_buffer = AsyncInsertBuffer()
+atexit.register(_async_insert_buffer.close)
+
+def insert_row(host:str, user:str, password:str, database:str, table_name:str, data:Dict[str, Any], port: int = 3306, async_mode: bool = False) -> Union[bool, 'Future[bool]']:
     """
     Inserts a single row into the specified table.
 
@@ -19,32 +336,35 @@ def insert_row(host:str, user:str, password:str, database:str, table_name:str, d
         database (str): The database name.
         table_name (str): The name of the table to insert into.
         data (Dict[str, Any]): A dictionary containing column names and their values.
+        port (int): The port number for the MySQL server.
+        async_mode (bool): If True, the row is buffered and written together with other rows for the
+            same table and columns within DBMCP_ASYNC_INSERT_WAIT_MS.
 
     Returns:
-        bool: True if the insertion was successful, False otherwise.
+        Union[bool, Future[bool]]: True if the insertion was successful, False otherwise. In async mode,
+        a Future that resolves to that result once the row's batch has been written.
     """
+    if async_mode:
+        return _async_insert_buffer.submit(host, user, password, database, table_name, data, port)
+
+    connection = None
     try:
-        connection:MySQLConnection = connect_to_mysql(host=host, user=user, password=password, database=database)
-        if not connection:
-            logger.error(f"Error connecting to database '{database}'")
-            return False
-
-        cursor:MySQLCursor = connection.cursor()
-        columns = ','.join(data.keys())
-        values = ', '.join(['%s'] * len(data))
-        query = f"INSERT INTO `{table_name}` ({columns}) VALUES ({values})"
-        logger.info(f"Executing query: \n{query}")
-        cursor.execute(query, list(data.values()))
-        connection.commit()
-        cursor.close()
-        connection.close()
-        logger.info(f"Inserted {table_name} row")
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
+
+        query = _insert_template(table_name, tuple(data))
+        logger.debug("Executing query: \n%s", query)
+        with connection.cursor() as cursor:
+            cursor.execute(query, tuple(data.values()))
+        logger.info("Inserted %s row", table_name)
         return True
     except Error as e:
-        logger.error(f"Error inserting row '{table_name}': {e}")
+        logger.error("Error inserting row '%s': %s", table_name, e)
         return False
+    finally:
+        if connection:
+            connection.close()
 
-def insert_multiple_rows(host: str, user: str, password: str, database: str, table_name: str, data: List[Dict[str, Any]]) -> bool:
+def insert_multiple_rows(host: str, user: str, password: str, database: str, table_name: str, data: List[Dict[str, Any]], port: int = 3306) -> bool:
     """
     Inserts multiple rows into the specified table.
 
@@ -55,31 +375,52 @@ def insert_multiple_rows(host: str, user: str, password: str, database: str, tab
         database (str): The database name.
         table_name (str): The name of the table to insert into.
         data (List[Dict[str, Any]]): A list of dictionaries, each representing a row to insert.
+        port (int): The port number for the MySQL server.
 
     Returns:
         bool: True if the insertion was successful, False otherwise.
     """
+    if not data:
+        logger.error("Refusing to insert an empty list of rows into '%s'", table_name)
+        return False
+
+    # Values are bound by column name, so every row must have exactly the first row's columns
+    columns = tuple(data[0])
+    column_set = set(columns)
+    if any(row.keys() != column_set for row in data):
+        logger.error("Rows inserted into '%s' must all have the columns %s", table_name, list(columns))
+        return False
+    values = _row_values(columns)
+
+    connection = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
-        cursor: MySQLCursor = connection.cursor()
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
+        rows = map(values, data)
 
-        columns = ', '.join(data[0].keys())
-        values = ', '.join(['%s'] * len(data[0]))
-        query = f"INSERT INTO {table_name} ({columns}) VALUES ({values})"
+        if len(data) >= LOAD_DATA_THRESHOLD:
+            try:
+                _load_rows(connection, table_name, columns, rows)
+                logger.info("%s rows loaded into table '%s'.", len(data), table_name)
+                return True
+            except Error as e:
+                if e.errno not in _LOCAL_INFILE_DISABLED:
+                    raise
+                logger.warning("LOAD DATA LOCAL INFILE is disabled, falling back to INSERT: %s", e)
+                rows = map(values, data)
 
-        cursor.executemany(query, [tuple(row.values()) for row in data])
-        connection.commit()
-        logger.info(f"{len(data)} rows inserted into table '{table_name}'.")
-        cursor.close()
-        connection.close()
+        _insert_rows(connection, table_name, columns, rows)
+        logger.info("%s rows inserted into table '%s'.", len(data), table_name)
         return True
     except Error as e:
-        logger.error(f"Error inserting multiple rows into table '{table_name}': {e}")
+        logger.error("Error inserting multiple rows into table '%s': %s", table_name, e)
         return False
+    finally:
+        if connection:
+            connection.close()
 
 
 
-def update_rows(host: str, user: str, password: str, database: str, table_name: str, data: Dict[str, Any], conditions: Dict[str, Any]) -> bool:
+def update_rows(host: str, user: str, password: str, database: str, table_name: str, data: Dict[str, Any], conditions: Dict[str, Any], port: int = 3306) -> bool:
     """
     Updates rows in the specified table based on conditions.
 
@@ -91,30 +432,38 @@ def update_rows(host: str, user: str, password: str, database: str, table_name:
         table_name (str): The name of the table to update.
         data (Dict[str, Any]): A dictionary containing columns and their new values.
         conditions (Dict[str, Any]): A dictionary containing conditions to match for updating.
+        port (int): The port number for the MySQL server.
 
     Returns:
         bool: True if the update was successful, False otherwise.
     """
+    # An UPDATE without SET or WHERE is either invalid or touches every row
+    if not data or not conditions:
+        logger.error("Refusing to update '%s' without both data and conditions", table_name)
+        return False
+    if not all(map(is_identifier, (table_name, *data, *conditions))):
+        logger.error("Invalid table or column name in update of '%s'", table_name)
+        return False
+
+    connection = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
-        cursor: MySQLCursor = connection.cursor()
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
 
-        set_clause = ', '.join([f"{k} = %s" for k in data.keys()])
-        where_clause = ' AND '.join([f"{k} = %s" for k in conditions.keys()])
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
+        query = _update_template(table_name, tuple(data), tuple(conditions))
 
-        cursor.execute(query, list(data.values()) + list(conditions.values()))
-        connection.commit()
-        logger.info(f"Rows updated in table '{table_name}' with conditions: {conditions}.")
-        cursor.close()
-        connection.close()
+        with connection.cursor() as cursor:
+            cursor.execute(query, (*data.values(), *conditions.values()))
+        logger.info("Rows updated in table '%s' with conditions: %s.", table_name, conditions)
         return True
     except Error as e:
-        logger.error(f"Error updating rows in table '{table_name}': {e}")
+        logger.error("Error updating rows in table '%s': %s", table_name, e)
         return False
+    finally:
+        if connection:
+            connection.close()
 
 
-def delete_rows(host: str, user: str, password: str, database: str, table_name: str, conditions: Dict[str, Any]) -> bool:
+def delete_rows(host: str, user: str, password: str, database: str, table_name: str, conditions: Dict[str, Any], port: int = 3306) -> bool:
     """
     Deletes rows from the specified table based on conditions.
 
@@ -125,23 +474,32 @@ def delete_rows(host: str, user: str, password: str, database: str, table_name:
         database (str): The database name.
         table_name (str): The name of the table to delete from.
         conditions (Dict[str, Any]): A dictionary containing conditions to match for deletion.
+        port (int): The port number for the MySQL server.
 
     Returns:
         bool: True if the deletion was successful, False otherwise.
     """
+    # A DELETE without WHERE would empty the table
+    if not conditions:
+        logger.error("Refusing to delete from '%s' without conditions", table_name)
+        return False
+    if not all(map(is_identifier, (table_name, *conditions))):
+        logger.error("Invalid table or column name in delete from '%s'", table_name)
+        return False
+
+    connection = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database)
-        cursor: MySQLCursor = connection.cursor()
+        connection: MySQLConnection = get_pool(host, user, password, database, port).get_connection()
 
-        where_clause = ' AND '.join([f"{k} = %s" for k in conditions.keys()])
-        query = f"DELETE FROM {table_name} WHERE {where_clause}"
+        query = f"DELETE FROM {quote_ident(table_name)} WHERE {_where_clause(tuple(conditions))}"
 
-        cursor.execute(query, list(conditions.values()))
-        connection.commit()
-        logger.info(f"Rows deleted from table '{table_name}' with conditions: {conditions}.")
-        cursor.close()
-        connection.close()
+        with connection.cursor() as cursor:
+            cursor.execute(query, tuple(conditions.values()))
+        logger.info("Rows deleted from table '%s' with conditions: %s.", table_name, conditions)
         return True
     except Error as e:
-        logger.error(f"Error deleting rows from table '{table_name}': {e}")
+        logger.error("Error deleting rows from table '%s': %s", table_name, e)
         return False
+    finally:
+        if connection:
+            connection.close()
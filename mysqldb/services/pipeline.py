@@ -0,0 +1,110 @@
+from mysqldb.services.pool import get_pool
+from mysqldb.services.cache import invalidate_schema_cache
+from mysqldb.services.sql import is_read_only
+from config.logger_config import LoggerFactory
+
+from typing import Any, List, Optional, Sequence, Tuple
+from mysql.connector import Error
+from mysql.connector.cursor import MySQLCursor
+
+import itertools
+
+logger = LoggerFactory.get_logger(__name__)
+
+def execute_pipeline(host: str, user: str, password: str, database: str, statements: List[Tuple[str, Sequence[Any]]], port: int = 3306) -> Optional[List[list]]:
+    """
+    Executes several statements in a single round-trip.
+
+    The statements are joined into one multi-statement query, so the client does not wait for each
+    response before sending the next statement. Pooled connections are opened with the connector's
+    default client flags, which include MULTI_STATEMENTS. Parameters are bound client-side, in order,
+    across the joined text.
+
+    The batch runs in one transaction: data changes are committed together or rolled back if any
+    statement fails. DDL statements still commit implicitly, as they always do in MySQL.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        statements (List[Tuple[str, Sequence[Any]]]): (sql, params) pairs using %s placeholders.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[List[list]]: One result set per statement (empty for statements that return no rows),
+        or None if an error occurs.
+    """
+    if not statements:
+        return []
+
+    query, params = _join(statements)
+    try:
+        with get_pool(host, user, password, database, port).get_connection() as connection:
+            connection.disable_autocommit()
+            with connection.cursor() as cursor:
+                logger.debug("Executing pipeline of %s statements", len(statements))
+                results = _execute(cursor, query, params)
+            connection.commit()
+        return results
+
+    except Error as e:
+        logger.error("Error executing pipeline: %s", e)
+        return None
+    finally:
+        # DDL commits implicitly, so it may have been applied even when the batch was rolled back
+        if not all(is_read_only(sql) for sql, _ in statements):
+            invalidate_schema_cache(host, database)
+
+def run_batch(host: str, user: str, password: str, database: str, queries: List[Tuple[str, Sequence[Any]]], port: int = 3306) -> Optional[List[list]]:
+    """
+    Executes several independent read-only queries in a single round-trip.
+
+    Unlike execute_pipeline, the batch opens no transaction and is routed to a read replica when
+    DBMCP_READ_HOSTS is set, so it must only contain statements that do not write.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        queries (List[Tuple[str, Sequence[Any]]]): (sql, params) pairs using %s placeholders.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[List[list]]: One result set per query, or None if a query is not read-only or an error occurs.
+    """
+    if not queries:
+        return []
+    # Writes must never reach a replica, so anything but a single read statement is refused
+    writes = [sql for sql, _ in queries if not is_read_only(sql)]
+    if writes:
+        logger.error("Batch contains %s statements that are not read-only, e.g. %s", len(writes), writes[0])
+        return None
+
+    query, params = _join(queries)
+    try:
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            logger.debug("Executing batch of %s queries", len(queries))
+            return _execute(cursor, query, params)
+
+    except Error as e:
+        logger.error("Error executing batch: %s", e)
+        return None
+
+def _join(statements: List[Tuple[str, Sequence[Any]]]) -> Tuple[str, list]:
+    """
+    Joins (sql, params) pairs into one multi-statement query and its flattened parameters.
+    """
+    query = "; ".join(sql.strip().rstrip(";") for sql, _ in statements)
+    params = list(itertools.chain.from_iterable(params for _, params in statements))
+    return query, params
+
+def _execute(cursor: MySQLCursor, query: str, params: list) -> List[list]:
+    """
+    Executes a joined multi-statement query and collects one result set per statement.
+    """
+    cursor.execute(query, params)
+
+    # A failing statement stops the batch; its error is raised while advancing to its result
+    return [rows for _, rows in cursor.fetchsets()]
@@ -0,0 +1,449 @@
+from mysql.connector import connect, Error, MySQLConnection, HAVE_CEXT
+from mysql.connector.errors import InterfaceError, OperationalError, PoolError
+from config.logger_config import LoggerFactory
+from mysql.connector.cursor import MySQLCursorPrepared
+from collections import deque, OrderedDict
+from typing import Any, Deque, Dict, List, Literal, Optional, Sequence, Tuple
+
+import atexit
+import functools
+import hmac
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+# Set up logger for this module
+logger = LoggerFactory.get_logger(__name__)
+
+# Maximum number of connections open at once per (host, port, user, database)
+POOL_SIZE = int(os.getenv("DBMCP_POOL_SIZE", "8"))
+
+# Seconds to wait for a free slot once a pool has POOL_SIZE connections open
+POOL_TIMEOUT = float(os.getenv("DBMCP_POOL_TIMEOUT", "10"))
+
+# Seconds allowed for establishing a new connection
+CONNECT_TIMEOUT = int(os.getenv("DBMCP_CONNECT_TIMEOUT", "5"))
+
+# Idle connections released cleanly less than this many milliseconds ago are reused without a ping; the
+# session reset on release is itself a round-trip, so they were known to be alive when they went idle
+IDLE_TTL_MS = float(os.getenv("DBMCP_IDLE_TTL_MS", "1000"))
+
+# Read replicas as comma-separated host or host:port entries; replica-routed reads are spread over them round-robin
+READ_HOSTS: List[Tuple[str, Optional[int]]] = [
+    (host, int(port) if port else None)
+    for host, _, port in (entry.strip().partition(":") for entry in os.getenv("DBMCP_READ_HOSTS", "").split(","))
+    if host
+]
+
+# zlib protocol compression trades client and server CPU for fewer bytes on the wire; it pays off
+# over WAN links and for large results. Replica pools serve the result-heavy reads, so they compress by default
+COMPRESS = os.getenv("DBMCP_COMPRESS", "0") == "1"
+COMPRESS_REPLICAS = os.getenv("DBMCP_COMPRESS_REPLICAS", "1") == "1"
+
+# Maximum number of prepared statements kept open per connection; stays well below the server's max_prepared_stmt_count
+STATEMENT_CACHE_SIZE = int(os.getenv("DBMCP_STATEMENT_CACHE_SIZE", "64"))
+
+class StatementCache:
+    """
+    A least-recently-used cache of prepared cursors belonging to a single connection.
+
+    Prepared statements live on the server side of one connection, so each connection owns its
+    own cache. The evicted cursor is closed, which releases its server-side statement handle.
+    """
+
+    def __init__(self, connection: MySQLConnection, maxsize: int = STATEMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._connection = connection
+        self._cursors: 'OrderedDict[Tuple[str, bool], Tuple[str, MySQLCursorPrepared]]' = OrderedDict()
+
+    def get(self, query: str, dictionary: bool = False) -> Tuple[str, MySQLCursorPrepared]:
+        """
+        Returns the prepared cursor for a query, creating it on a miss.
+
+        Statements are keyed by their exact text, so the SQL that runs is always the caller's own.
+        The returned query string is the cached instance of that text; the connector only skips
+        re-preparing when it is executed with that exact object.
+
+        Args:
+            query (str): The parameterized SQL text.
+            dictionary (bool): Whether the cursor should return rows as dictionaries.
+
+        Returns:
+            Tuple[str, MySQLCursorPrepared]: The cached query string and its prepared cursor.
+        """
+        key = (query, dictionary)
+        entry = self._cursors.get(key)
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            return entry
+
+        entry = (query, self._connection.cursor(prepared=True, dictionary=dictionary))
+        self._cursors[key] = entry
+        if len(self._cursors) > self.maxsize:
+            _, (_, evicted) = self._cursors.popitem(last=False)
+            self._close_cursor(evicted)
+        return entry
+
+    def close(self) -> None:
+        """
+        Closes every cached cursor, releasing their server-side statement handles.
+        """
+        while self._cursors:
+            _, (_, cursor) = self._cursors.popitem(last=False)
+            self._close_cursor(cursor)
+
+    @staticmethod
+    def _close_cursor(cursor: MySQLCursorPrepared) -> None:
+        try:
+            cursor.close()
+        except Error as e:
+            logger.warning("Error while closing prepared statement: %s", e)
+
+    def clear(self) -> None:
+        """
+        Forgets every cached cursor without contacting the server, e.g. after a reconnect.
+        """
+        self._cursors.clear()
+
+class ConnectionPool:
+    """
+    A bounded pool of MySQL connections with a lock-free acquire/release fast path.
+
+    Idle connections sit in a deque and are reused last-in first-out, so the most recently used
+    connection, the one least likely to have timed out, is handed out first. deque.pop() and
+    deque.append() are atomic, so only opening a new connection goes through the semaphore.
+    """
+
+    def __init__(self, max_size: int, **config: Any):
+        self.max_size = max_size
+        self._config = config
+        self._idle: Deque[MySQLConnection] = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+        self._max_allowed_packet: Optional[int] = None
+
+    def get_connection(self) -> 'PooledConnection':
+        """
+        Borrows a connection from the pool, opening a new one if none are idle.
+
+        Returns:
+            PooledConnection: A connection whose close() returns it to this pool.
+
+        Raises:
+            PoolError: If the pool is full and no connection is released within POOL_TIMEOUT.
+            Error: If a new connection cannot be opened.
+        """
+        while True:
+            try:
+                connection = self._idle.pop()
+            except IndexError:
+                connection = self._open()
+                break
+
+            # Connections that passed their release reset moments ago are trusted without a round-trip
+            if (time.monotonic() - connection._returned_at) * 1000 < IDLE_TTL_MS:
+                break
+            if self._revive(connection):
+                break
+            self._discard(connection)
+        return PooledConnection(self, connection)
+
+    def release(self, connection: MySQLConnection) -> None:
+        """
+        Returns a borrowed connection to the idle set.
+
+        Only connections whose session was reset cleanly may be released; PooledConnection.close()
+        discards broken ones instead, so everything in the idle set was alive when it went idle.
+
+        Args:
+            connection (MySQLConnection): The connection being returned.
+        """
+        if self._closed:
+            self._discard(connection)
+        else:
+            connection._returned_at = time.monotonic()
+            self._idle.append(connection)
+
+    def max_allowed_packet(self, connection: MySQLConnection) -> int:
+        """
+        Returns the server's max_allowed_packet, queried once per pool and cached.
+
+        Args:
+            connection (MySQLConnection): A connection from this pool to query through.
+
+        Returns:
+            int: The largest packet the server accepts, in bytes.
+        """
+        if self._max_allowed_packet is None:
+            cursor = connection.cursor()
+            cursor.execute("SELECT @@max_allowed_packet")
+            self._max_allowed_packet = int(cursor.fetchone()[0])
+            cursor.close()
+        return self._max_allowed_packet
+
+    def close(self) -> None:
+        """
+        Closes every idle connection. Connections still borrowed are closed when they are released.
+        """
+        self._closed = True
+        while True:
+            try:
+                connection = self._idle.pop()
+            except IndexError:
+                break
+            self._discard(connection)
+
+    def _open(self) -> MySQLConnection:
+        if not self._slots.acquire(timeout=POOL_TIMEOUT):
+            raise PoolError(f"Connection pool exhausted: all {self.max_size} connections are in use")
+        try:
+            return connect(**self._config)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _revive(self, connection: MySQLConnection) -> bool:
+        # COM_PING is a single small round-trip, far cheaper than a fresh TCP + auth handshake
+        try:
+            connection.ping(attempts=1, delay=0)
+            return True
+        except (InterfaceError, OperationalError):
+            pass
+
+        # A reconnect starts a new session, so its prepared statements are gone
+        statement_cache(connection).clear()
+        try:
+            connection.ping(reconnect=True, attempts=1, delay=0)
+            return True
+        except (InterfaceError, OperationalError) as e:
+            logger.warning("Discarding pooled connection that failed to reconnect: %s", e)
+            return False
+
+    def _discard(self, connection: MySQLConnection) -> None:
+        try:
+            statement_cache(connection).close()
+            connection.close()
+        except Error as e:
+            logger.warning("Error while closing discarded connection: %s", e)
+        finally:
+            self._slots.release()
+
+class PooledConnection:
+    """
+    A MySQL connection borrowed from a ConnectionPool.
+
+    Behaves like the wrapped MySQLConnection, except that close() hands the connection back to
+    the pool instead of closing the socket.
+    """
+
+    def __init__(self, pool: ConnectionPool, connection: MySQLConnection):
+        self._pool = pool
+        self._connection = connection
+        self._restore_autocommit = False
+        self._broken = False
+
+    def disable_autocommit(self) -> None:
+        """
+        Turns autocommit off for this borrow; it is switched back on when the connection is released.
+        """
+        self._connection.autocommit = False
+        self._restore_autocommit = True
+
+    def mark_broken(self) -> None:
+        """
+        Flags the connection as unusable, so close() discards it instead of returning it to the pool.
+        """
+        self._broken = True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        # The connection itself failed, so its session cannot be trusted to reset cleanly
+        if isinstance(exc_value, (InterfaceError, OperationalError)):
+            self.mark_broken()
+        self.close()
+
+    def max_allowed_packet(self) -> int:
+        """
+        Returns the server's max_allowed_packet as cached by the pool.
+        """
+        return self._pool.max_allowed_packet(self._connection)
+
+    def close(self) -> None:
+        """
+        Returns the connection to its pool with a clean session. Further calls are no-ops.
+
+        Any open transaction is rolled back and the session is reset with COM_RESET_CONNECTION, which
+        drops temporary tables, user variables, session settings and server-side prepared statements.
+        The reset keeps the current database, so the pool's database is selected again in case the
+        borrower ran USE. A connection that cannot be reset, or whose borrower exited with an
+        InterfaceError or OperationalError, is closed instead of being reused.
+        """
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        if self._broken:
+            self._pool._discard(connection)
+            return
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            if self._restore_autocommit:
+                connection.autocommit = True
+            if not connection.cmd_reset_connection():
+                raise InterfaceError("Server rejected COM_RESET_CONNECTION")
+            # The reset freed the server-side statements behind the cached cursors
+            statement_cache(connection).clear()
+            database = self._pool._config.get("database")
+            if database:
+                connection.cmd_init_db(database)
+        except Error as e:
+            logger.warning("Discarding pooled connection that could not be reset: %s", e)
+            self._pool._discard(connection)
+        else:
+            self._pool.release(connection)
+
+def statement_cache(connection: MySQLConnection) -> StatementCache:
+    """
+    Returns the prepared statement cache of a raw connection, creating it on first use.
+
+    Args:
+        connection (MySQLConnection): The underlying connection, not its pooled wrapper.
+
+    Returns:
+        StatementCache: The cache tied to that connection's server session.
+    """
+    cache = getattr(connection, '_stmt_cache', None)
+    if cache is None:
+        cache = StatementCache(connection)
+        connection._stmt_cache = cache
+    return cache
+
+def execute_prepared(connection: PooledConnection, query: str, params: Sequence[Any] = (), dictionary: bool = False) -> MySQLCursorPrepared:
+    """
+    Executes a parameterized query through the connection's prepared statement cache.
+
+    This is the opt-in binary-protocol path behind execute_custom_query(prepared=True); the
+    service functions themselves run on text-protocol cursors.
+
+    Rows come back in the binary protocol, but the connector sends COM_STMT_RESET before every
+    execution, so a cached statement costs two round-trips and a new one three, against one for a
+    text-protocol cursor.execute(). Use it only where binary decoding of large results has been
+    measured to outweigh that; one-shot queries should stay on the text protocol.
+
+    The returned cursor is owned by the cache: fetch its results, but do not close it.
+
+    Args:
+        connection (PooledConnection): The connection to execute on.
+        query (str): The parameterized SQL text, using %s placeholders.
+        params (Sequence[Any]): The values bound to the placeholders.
+        dictionary (bool): Whether fetched rows should be dictionaries.
+
+    Returns:
+        MySQLCursorPrepared: The prepared cursor holding the results of the execution.
+    """
+    query, cursor = statement_cache(connection._connection).get(query, dictionary)
+    cursor.execute(query, tuple(params))
+    return cursor
+
+@functools.lru_cache(maxsize=None)
+def local_infile_dir() -> str:
+    """
+    Returns the private directory that LOAD DATA LOCAL INFILE may read from, creating it on first use.
+
+    Pooled connections only allow local infile from this directory, so a server cannot request
+    arbitrary client files. It is removed when the process exits.
+
+    Returns:
+        str: The absolute path of the directory.
+    """
+    path = tempfile.mkdtemp(prefix="dbmcp-infile-")
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+# Pools by (host, port, user, database, compress), each paired with the password it was built with
+_pools: Dict[Tuple[str, int, str, str, bool], Tuple[str, ConnectionPool]] = {}
+_pools_lock = threading.Lock()
+
+def _same_password(expected: str, given: str) -> bool:
+    # Constant-time, so response timing does not reveal how much of a password matched
+    return hmac.compare_digest(expected.encode(), given.encode())
+
+_read_hosts = itertools.cycle(READ_HOSTS)
+_read_hosts_lock = threading.Lock()
+
+def get_pool(host:str, user:str, password:str, database:str, port:int = 3306, role: Literal["primary", "replica"] = "primary", compress: Optional[bool] = None) -> ConnectionPool:
+    """
+    Returns the connection pool for the given connection parameters, creating it on first use.
+
+    Borrow with get_connection() and hand the connection back with close(). Pools hold at most
+    DBMCP_POOL_SIZE connections each. A pool built with a different password is discarded and
+    rebuilt so that stale credentials never keep connections alive.
+
+    With role="replica", the pool of the next host in DBMCP_READ_HOSTS is returned instead, using
+    the same credentials and database. Replicas may lag behind the primary, so only reads that
+    tolerate slightly stale data should use them. Without configured replicas both roles use host.
+
+    Args:
+        host (str): The host address of the MySQL server.
+        user (str): The username to authenticate with.
+        password (str): The password for the MySQL user.
+        database (str): The name of the database to connect to.
+        port (int): The port number of the MySQL server. Defaults to 3306.
+        role (Literal["primary", "replica"]): Whether the connection may be served by a read replica.
+        compress (Optional[bool]): Whether to use protocol compression. Defaults to DBMCP_COMPRESS for the
+            primary and DBMCP_COMPRESS_REPLICAS for replicas. Compressed and uncompressed pools are separate.
+
+    Returns:
+        ConnectionPool: The pool serving connections for these parameters.
+    """
+    if role == "replica" and READ_HOSTS:
+        with _read_hosts_lock:
+            replica_host, replica_port = next(_read_hosts)
+        host, port = replica_host, replica_port or port
+        if compress is None:
+            compress = COMPRESS_REPLICAS
+    if compress is None:
+        compress = COMPRESS
+
+    key = (host, port, user, database, compress)
+    entry = _pools.get(key)
+    if entry is not None and _same_password(entry[0], password):
+        return entry[1]
+
+    with _pools_lock:
+        entry = _pools.get(key)
+        if entry is not None and _same_password(entry[0], password):
+            return entry[1]
+
+        if entry is not None:
+            logger.info("Credentials changed for '%s'@'%s:%d/%s', rebuilding connection pool", user, host, port, database)
+            entry[1].close()
+
+        pool = ConnectionPool(
+            POOL_SIZE,
+            host=host,
+            user=user,
+            password=password,
+            database=database,
+            port=port,
+            autocommit=True,
+            use_pure=False,
+            consume_results=True,
+            connection_timeout=CONNECT_TIMEOUT,
+            allow_local_infile_in_path=local_infile_dir(),
+            compress=compress
+        )
+        _pools[key] = (password, pool)
+        logger.info("Created connection pool of size %d for database '%s' on port %d", POOL_SIZE, database, port)
+        if not HAVE_CEXT:
+            # connect() silently falls back to the pure-Python protocol implementation
+            logger.warning("mysql-connector-python C extension is not available; result parsing will be considerably slower")
+        return pool
@@ -1,17 +1,90 @@
-from mysqldb.services.connection import connect_to_mysql
+from mysqldb.services.pool import execute_prepared, get_pool
+from mysqldb.services.results import fetch_columnar, to_dicts
+from mysqldb.services.sql import AGGREGATIONS, SORT_ORDERS, is_identifier, is_read_only, keyword_in, quote_ident
+from mysqldb.services.cache import invalidate_schema_cache
+from mysqldb.services.schema import get_primary_key
 from config.logger_config import LoggerFactory
 
-from typing import Dict, Optional, List, Any
+from typing import Dict, Iterator, Optional, List, Any, Sequence, Tuple, Union
 from mysql.connector.cursor import MySQLCursor
-from mysql.connector.connection import MySQLConnection
 from mysql.connector import Error
 
+import contextlib
+import functools
+import json
+import os
+
 logger = LoggerFactory.get_logger(__name__)
 
-def get_all_rows(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Optional[List[Dict]]:
+# Rows pulled from the server per fetchmany() call when streaming
+STREAM_BATCH_SIZE = 1024
+
+# Most rows get_all_rows materializes; larger tables are truncated (use iter_all_rows to read them whole). 0 disables the cap
+MAX_ROWS = int(os.getenv("DBMCP_MAX_ROWS", "100000"))
+
+# Values bound per IN (...) statement by get_rows_in; larger key lists are split to stay under max_allowed_packet
+IN_CHUNK_SIZE = int(os.getenv("DBMCP_IN_CHUNK_SIZE", "2000"))
+
+@functools.lru_cache(maxsize=512)
+def _build_select(table_name: str, columns: Tuple[str, ...] = (), where: Tuple[str, ...] = (), suffix: str = "") -> str:
+    """
+    Builds a parameterized SELECT statement, memoized per shape.
+
+    Only identifiers shape the SQL; filter values are bound as %s parameters, so the cache stays
+    bounded and identical shapes return the same string object instead of being rebuilt per call.
+
+    Args:
+        table_name (str): The table to select from.
+        columns (Tuple[str, ...]): The columns to select. Empty selects every column.
+        where (Tuple[str, ...]): Columns compared for equality with a %s placeholder, joined with AND.
+        suffix (str): Trailing clauses such as ORDER BY or LIMIT.
+
+    Returns:
+        str: The SQL text.
+    """
+    select_list = ", ".join(map(quote_ident, columns)) if columns else "*"
+    query = f"SELECT {select_list} FROM {quote_ident(table_name)}"
+    if where:
+        query += " WHERE " + " AND ".join(f"{quote_ident(key)} = %s" for key in where)
+    return query + suffix
+
+@functools.lru_cache(maxsize=512)
+def _aggregate_query(table_name: str, aggregation: str, column: str, group_by: Optional[str] = None) -> str:
+    """
+    Builds an aggregate SELECT statement, optionally grouped, memoized per shape.
+
+    Callers validate aggregation against AGGREGATIONS first; identifiers are quoted here.
+
+    Args:
+        table_name (str): The table to aggregate.
+        aggregation (str): The aggregate function, e.g. SUM.
+        column (str): The column to aggregate.
+        group_by (Optional[str]): The column to group by, selected ahead of the aggregate.
+
+    Returns:
+        str: The SQL text.
+    """
+    aggregate = f"{aggregation}({quote_ident(column)})"
+    if group_by is None:
+        return f"SELECT {aggregate} FROM {quote_ident(table_name)}"
+    return f"SELECT {quote_ident(group_by)}, {aggregate} AS aggregate FROM {quote_ident(table_name)} GROUP BY {quote_ident(group_by)}"
+
+@functools.lru_cache(maxsize=128)
+def _build_select_in(table_name: str, column: str, count: int) -> str:
+    """
+    Builds a SELECT matching a column against count %s placeholders, memoized per shape.
+    """
+    placeholders = ", ".join(["%s"] * count)
+    return f"SELECT * FROM {quote_ident(table_name)} WHERE {quote_ident(column)} IN ({placeholders})"
+
+def get_all_rows(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Optional[Dict[str, list]]:
     """
     Retrieves all rows from the specified table in the given database.
 
+    Rows are returned in columnar form; use results.to_dicts() to turn them into dictionaries. The result
+    is materialized in memory, so at most DBMCP_MAX_ROWS rows are returned; use iter_all_rows() to
+    stream large tables in full instead.
+
     Args:
         host (str): The database host.
         user (str): The database user.
@@ -21,50 +94,39 @@ def get_all_rows(host: str, user: str, password: str, database: str, table_name:
         port (int): The port number for the MySQL server.
 
     Returns:
-        Optional[List[Dict]]: A list of dictionaries where each dictionary represents a row from the table.
-        Returns None if an error occurs or the table is empty.
+        Optional[Dict[str, list]]: {"columns": [...], "rows": [[...], ...]} with the column names listed once
+        and each row's values in column order. Returns None if an error occurs.
     """
-    connection = None
-    cursor = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host=host, user=user, password=password, database=database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database: '{database}'")
-            return None
+        # The cap is part of the statement rather than a session variable, so it never leaks to the next borrower
+        query = _build_select(table_name, suffix=f" LIMIT {MAX_ROWS:d}" if MAX_ROWS > 0 else "")
+        logger.debug("Executing query: %s", query)
+
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query)
+            result = fetch_columnar(cursor)
+
+        if not result["rows"]:
+            logger.warning("No data found in table '%s'", table_name)
+            return result
 
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
-        
-        query = f"SELECT * FROM {table_name};"
-        logger.info(f"Executing query: {query}")
-        cursor.execute(query)
-        
-        rows: List[Dict] = cursor.fetchall()
-        if not rows:
-            logger.warning(f"No data found in table '{table_name}'")
-            return []
+        if len(result["rows"]) == MAX_ROWS:
+            logger.warning("Result from '%s' reached DBMCP_MAX_ROWS=%d rows and may be truncated", table_name, MAX_ROWS)
 
-        logger.info(f"Successfully fetched {len(rows)} rows from '{table_name}'")
-        return rows
+        logger.info("Successfully fetched %s rows from '%s'", len(result['rows']), table_name)
+        return result
 
     except Error as e:
-        logger.error(f"Error occurred while fetching data from '{table_name}': {str(e)}")
+        logger.error("Error occurred while fetching data from '%s': %s", table_name, e)
         return None
 
-    finally:
-        try:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
-            logger.info("Database connection closed.")
-        except Exception as ex:
-            logger.error(f"Error while closing resources: {str(ex)}")
-
-def get_filtered_rows(
-    host: str, user: str, password: str, database: str, table_name: str, filters: Dict[str, Any], port: int = 3306
-) -> Optional[List[Dict]]:
+def get_rows(
+    host: str, user: str, password: str, database: str, table_name: str, filters: Optional[Dict[str, Any]] = None,
+    sort_by: Optional[str] = None, order: str = 'ASC', limit: Optional[int] = None, offset: int = 0, port: int = 3306,
+    columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
-    Retrieves rows from the specified table in the given database based on filter criteria.
+    Retrieves rows from the specified table, filtered, sorted and paginated by a single query.
 
     Args:
         host (str): The database host.
@@ -72,57 +134,169 @@ def get_filtered_rows(
         password (str): The database password.
         database (str): The name of the database.
         table_name (str): The name of the table to fetch data from.
-        filters (Dict[str, Any]): A dictionary where keys are column names and values are the filtering criteria.
+        filters (Optional[Dict[str, Any]]): Column names mapped to the values they must equal.
+        sort_by (Optional[str]): The column to sort by. Rows are returned in no particular order if omitted.
+        order (str): The sort order ('ASC' or 'DESC'). Default is 'ASC'.
+        limit (Optional[int]): The maximum number of rows to fetch. Every matching row is fetched if omitted.
+        offset (int): The number of rows to skip; only applies together with limit.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
 
     Returns:
-        Optional[List[Dict]]: A list of dictionaries where each dictionary represents a row from the table.
-        Returns None if an error occurs or no data matches the filters.
+        Optional[Union[List[Dict], Dict[str, list]]]: The rows as a list of dictionaries (or in columnar shape),
+        or None if the arguments are invalid or an error occurs.
     """
-    connection = None
-    cursor = None
+    filters = filters or {}
+    order = keyword_in(order, SORT_ORDERS)
+    if order is None or not all(map(is_identifier, (table_name, *filters, *((sort_by,) if sort_by else ())))):
+        logger.error("Invalid table, column or sort order in read from '%s'", table_name)
+        return None
+
+    suffix = f" ORDER BY {quote_ident(sort_by)} {order}" if sort_by else ""
+    values = tuple(filters.values())
+    if limit is not None:
+        suffix += " LIMIT %s OFFSET %s"
+        values += (limit, offset)
+
     try:
-        connection: MySQLConnection = connect_to_mysql(host=host, user=user, password=password, database=database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database: '{database}'")
-            return None
+        # Only the shape of the request reaches the SQL text, which is memoized; values are bound as parameters
+        query = _build_select(table_name, where=tuple(filters), suffix=suffix)
+        logger.debug("Executing query: %s with values %s", query, values)
 
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query, values)
+            result = fetch_columnar(cursor)
 
-        where_clauses = [f"`{key}` = %s" for key in filters.keys()]
-        where_statement = " AND ".join(where_clauses)
+        if not result["rows"]:
+            logger.warning("No data found in table '%s' with filters: %s", table_name, filters)
+        else:
+            logger.info("Successfully fetched %s rows from '%s'", len(result['rows']), table_name)
+        return result if columnar else to_dicts(result)
 
-        query = f"SELECT * FROM {table_name} WHERE {where_statement};"
-        values = list(filters.values())
-        logger.info(f"Executing query: {query} with values {values}")
+    except Error as e:
+        logger.error("Error occurred while fetching data from '%s': %s", table_name, e)
+        return None
 
-        cursor.execute(query, values)
+def get_rows_in(
+    host: str, user: str, password: str, database: str, table_name: str, column: str, values: Sequence[Any], port: int = 3306,
+    columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
+    """
+    Retrieves every row whose column equals one of the given values, instead of one lookup per value.
 
-        rows: List[Dict] = cursor.fetchall()
-        if not rows:
-            logger.warning(f"No data found in table '{table_name}' with filters: {filters}")
-            return []
+    Values are deduplicated and matched with IN (...) lists of at most DBMCP_IN_CHUNK_SIZE values, all
+    over one connection. Rows come back in no particular order relative to values; use
+    get_rows_by_key() to look them up by value.
 
-        logger.info(f"Successfully fetched {len(rows)} rows from '{table_name}'")
-        return rows
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The name of the database.
+        table_name (str): The name of the table to fetch data from.
+        column (str): The column to match, typically a primary or unique key.
+        values (Sequence[Any]): The values to look up.
+        port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
+
+    Returns:
+        Optional[Union[List[Dict], Dict[str, list]]]: The matching rows as a list of dictionaries (or in columnar
+        shape), or None if the arguments are invalid or an error occurs.
+    """
+    if not is_identifier(table_name) or not is_identifier(column):
+        logger.error("Invalid table or column name in lookup on '%s'", table_name)
+        return None
+    # MCP clients can send nested JSON, which is neither hashable nor bindable as a parameter
+    if any(isinstance(value, (dict, list, set, tuple)) for value in values):
+        logger.error("Lookup values on '%s' must be scalars", table_name)
+        return None
+
+    keys = tuple(dict.fromkeys(values))
+    result: Dict[str, list] = {"columns": [], "rows": []}
+    if not keys:
+        return result if columnar else []
+
+    try:
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            for start in range(0, len(keys), IN_CHUNK_SIZE):
+                chunk = keys[start:start + IN_CHUNK_SIZE]
+                query = _build_select_in(table_name, column, len(chunk))
+                logger.debug("Executing query: %s with %s values", query, len(chunk))
+
+                cursor.execute(query, chunk)
+                batch = fetch_columnar(cursor)
+                result["columns"] = batch["columns"]
+                result["rows"].extend(batch["rows"])
+
+        logger.info("Fetched %s rows for %s keys from '%s'", len(result['rows']), len(keys), table_name)
+        return result if columnar else to_dicts(result)
 
     except Error as e:
-        logger.error(f"Error occurred while fetching filtered data from '{table_name}': {str(e)}")
+        logger.error("Error looking up rows in '%s': %s", table_name, e)
         return None
 
-    finally:
-        try:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
-            logger.info("Database connection closed.")
-        except Exception as ex:
-            logger.error(f"Error while closing resources: {str(ex)}")
+def get_rows_by_key(
+    host: str, user: str, password: str, database: str, table_name: str, column: str, values: Sequence[Any], port: int = 3306
+) -> Optional[Dict[Any, Dict]]:
+    """
+    Retrieves rows by key like get_rows_in, indexed by their value in column.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The name of the database.
+        table_name (str): The name of the table to fetch data from.
+        column (str): The column to match; should be unique, otherwise the last row per value wins.
+        values (Sequence[Any]): The values to look up.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[Dict[Any, Dict]]: Each found value mapped to its row. Values without a row are left out.
+        Returns None if the arguments are invalid or an error occurs.
+    """
+    result = get_rows_in(host, user, password, database, table_name, column, values, port, columnar=True)
+    if result is None:
+        return None
+    if not result["rows"]:
+        return {}
+
+    # MySQL column names are case-insensitive, so the result may spell the key column differently
+    columns = result["columns"]
+    index = next((i for i, name in enumerate(columns) if name.lower() == column.lower()), None)
+    if index is None:
+        logger.error("Key column '%s' not found in rows from '%s'", column, table_name)
+        return None
+    return {row[index]: dict(zip(columns, row)) for row in result["rows"]}
+
+def get_filtered_rows(
+    host: str, user: str, password: str, database: str, table_name: str, filters: Dict[str, Any], port: int = 3306, columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
+    """
+    Retrieves rows from the specified table in the given database based on filter criteria.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The name of the database.
+        table_name (str): The name of the table to fetch data from.
+        filters (Dict[str, Any]): A dictionary where keys are column names and values are the filtering criteria.
+        port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
+
+    Returns:
+        Optional[Union[List[Dict], Dict[str, list]]]: A list of dictionaries where each dictionary represents a row
+        from the table, or the columnar shape if requested. Returns None if an error occurs.
+    """
+    return get_rows(host, user, password, database, table_name, filters=filters, port=port, columnar=columnar)
 
 def get_sorted_rows(
-    host: str, user: str, password: str, database: str, table_name: str, sort_by: str, order: str = 'ASC', port: int = 3306
-) -> Optional[List[Dict]]:
+    host: str, user: str, password: str, database: str, table_name: str, sort_by: str, order: str = 'ASC', port: int = 3306, columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Retrieves sorted rows from the specified table.
 
@@ -135,43 +309,24 @@ def get_sorted_rows(
         sort_by (str): The column to sort by.
         order (str): The sort order ('ASC' or 'DESC'). Default is 'ASC'.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
 
     Returns:
-        Optional[List[Dict]]: Sorted rows as a list of dictionaries, or None on error.
+        Optional[Union[List[Dict], Dict[str, list]]]: Sorted rows as a list of dictionaries (or in columnar shape),
+        or None on error.
     """
-    connection = None
-    cursor = None
-    try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database: '{database}'")
-            return None
-
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
-
-        query = f"SELECT * FROM {table_name} ORDER BY `{sort_by}` {order};"
-        logger.info(f"Executing query: {query}")
-
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        return rows
-
-    except Error as e:
-        logger.error(f"Error fetching sorted rows from '{table_name}': {str(e)}")
-        return None
-
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
+    return get_rows(host, user, password, database, table_name, sort_by=sort_by, order=order, port=port, columnar=columnar)
 
 def get_limited_rows(
-    host: str, user: str, password: str, database: str, table_name: str, limit: int, offset: int = 0, port: int = 3306
-) -> Optional[List[Dict]]:
+    host: str, user: str, password: str, database: str, table_name: str, limit: int, offset: int = 0, port: int = 3306, columnar: bool = False
+) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Retrieves a limited number of rows from the specified table.
 
+    The server reads and discards every row before offset, so deep pages get slower the further
+    they go; keep offsets small and use get_page_after to walk large tables.
+
     Args:
         host (str): The database host.
         user (str): The database user.
@@ -181,37 +336,76 @@ def get_limited_rows(
         limit (int): The number of rows to fetch.
         offset (int): The starting point for fetching rows. Default is 0.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
 
     Returns:
-        Optional[List[Dict]]: Limited rows as a list of dictionaries, or None on error.
+        Optional[Union[List[Dict], Dict[str, list]]]: Limited rows as a list of dictionaries (or in columnar shape),
+        or None on error.
     """
-    connection = None
-    cursor = None
-    try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database: '{database}'")
-            return None
+    return get_rows(host, user, password, database, table_name, limit=limit, offset=offset, port=port, columnar=columnar)
 
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+def get_page_after(
+    host: str, user: str, password: str, database: str, table_name: str, limit: int, after_value: Any = None, pk_column: Optional[str] = None, port: int = 3306
+) -> Optional[Dict[str, Any]]:
+    """
+    Retrieves the next page of rows in key order using keyset pagination.
 
-        query = f"SELECT * FROM {table_name} LIMIT %s OFFSET %s;"
-        logger.info(f"Executing query: {query}")
+    Each page seeks directly to the rows after after_value through the key's index, so every page
+    costs the same no matter how deep it is, unlike LIMIT/OFFSET.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table name.
+        limit (int): The number of rows to fetch.
+        after_value (Any): The key of the last row of the previous page. None fetches the first page.
+        pk_column (Optional[str]): A unique, indexed column to page by. Defaults to the table's primary key.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[Dict[str, Any]]: {"rows": [...], "last_value": ...}, where last_value is passed as after_value
+        to fetch the next page and is None once there are no more rows. Returns None on error.
+    """
+    column = pk_column
+    if column is None:
+        # Looked up through the schema cache, so it follows tables that are dropped or recreated
+        columns = get_primary_key(host, user, password, database, table_name, port)
+        if columns is None:
+            return None
+        if len(columns) != 1:
+            logger.error("Table '%s' needs a single-column primary key for keyset pagination, found %s", table_name, columns)
+            return None
+        column = columns[0]
 
-        cursor.execute(query, (limit, offset))
-        rows = cursor.fetchall()
-        return rows
+    try:
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection:
+            if after_value is None:
+                query = _build_select(table_name, suffix=f" ORDER BY {quote_ident(column)} LIMIT %s")
+                params = (limit,)
+            else:
+                query = _build_select(table_name, suffix=f" WHERE {quote_ident(column)} > %s ORDER BY {quote_ident(column)} LIMIT %s")
+                params = (after_value, limit)
+            logger.debug("Executing query: %s with values %s", query, params)
+
+            with connection.cursor() as cursor:
+                cursor.execute(query, params)
+                result = fetch_columnar(cursor)
+
+        # pk_column may differ in case from the name the server returns, so the cursor is read by position
+        rows = result["rows"]
+        index = next((i for i, name in enumerate(result["columns"]) if name.lower() == column.lower()), None)
+        if index is None:
+            logger.error("Key column '%s' not found in rows from '%s'", column, table_name)
+            return None
+        return {"rows": to_dicts(result), "last_value": rows[-1][index] if rows else None}
 
     except Error as e:
-        logger.error(f"Error fetching limited rows from '{table_name}': {str(e)}")
+        logger.error("Error fetching page from '%s': %s", table_name, e)
         return None
 
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
-
 def get_distinct_values(
     host: str, user: str, password: str, database: str, table_name: str, column: str, port: int = 3306
 ) -> Optional[List[Any]]:
@@ -230,33 +424,18 @@ def get_distinct_values(
     Returns:
         Optional[List[Any]]: A list of distinct values or None on error.
     """
-    connection = None
-    cursor = None
-    try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database: '{database}'")
-            return None
-
-        cursor: MySQLCursor = connection.cursor()
-
-        query = f"SELECT DISTINCT `{column}` FROM {table_name};"
-        logger.info(f"Executing query: {query}")
+    if not is_identifier(table_name) or not is_identifier(column):
+        logger.error("Invalid table or column name for distinct values: '%s'.'%s'", table_name, column)
+        return None
 
-        cursor.execute(query)
-        values = [row[0] for row in cursor.fetchall()]
-        return values
+    try:
+        # Values are unpacked as they are streamed, so no intermediate list of one-element rows is built
+        return list(iter_distinct_values(host, user, password, database, table_name, column, port))
 
     except Error as e:
-        logger.error(f"Error fetching distinct values from '{table_name}': {str(e)}")
+        logger.error("Error fetching distinct values from '%s': %s", table_name, e)
         return None
 
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
-
 def get_aggregated_data(
     host: str, user: str, password: str, database: str, table_name: str, aggregation: str, column: str, port: int = 3306
 ) -> Optional[Any]:
@@ -271,31 +450,24 @@ def get_aggregated_data(
     Returns:
         Optional[Any]: The result of the aggregation or None on error.
     """
-    connection = None
-    cursor = None
-    try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            return None
-        cursor: MySQLCursor = connection.cursor()
+    function = keyword_in(aggregation, AGGREGATIONS)
+    if function is None or not is_identifier(table_name) or not is_identifier(column):
+        logger.error("Invalid aggregation on '%s': %s(%s)", table_name, aggregation, column)
+        return None
 
-        query = f"SELECT {aggregation}(`{column}`) FROM {table_name};"
-        logger.info(f"Executing query: {query}")
+    try:
+        query = _aggregate_query(table_name, function, column)
+        logger.debug("Executing query: %s", query)
 
-        cursor.execute(query)
-        result = cursor.fetchone()
-        return result[0] if result else None
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query)
+            result = cursor.fetchall()
+        return result[0][0] if result else None
 
     except Error as e:
-        logger.error(f"Error in aggregation on '{table_name}': {str(e)}")
+        logger.error("Error in aggregation on '%s': %s", table_name, e)
         return None
 
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
-
 def get_grouped_data(
     host: str, user: str, password: str, database: str, table_name: str, group_by: str, aggregation: str, column: str, port: int = 3306
 ) -> Optional[Dict[str, Any]]:
@@ -317,34 +489,30 @@ def get_grouped_data(
         Optional[Dict[str, Any]]: A dictionary where keys are group values and values are aggregated data,
         or None if an error occurs.
     """
-    connection = None
-    cursor = None
-    try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            return None
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+    function = keyword_in(aggregation, AGGREGATIONS)
+    if function is None or not all(map(is_identifier, (table_name, group_by, column))):
+        logger.error("Invalid grouping on '%s': %s(%s) by %s", table_name, aggregation, column, group_by)
+        return None
 
-        query = f"SELECT `{group_by}`, {aggregation}(`{column}`) AS aggregate FROM {table_name} GROUP BY `{group_by}`;"
-        logger.info(f"Executing query: {query}")
+    try:
+        query = _aggregate_query(table_name, function, column, group_by)
+        logger.debug("Executing query: %s", query)
 
-        cursor.execute(query)
-        results = cursor.fetchall()
-        return {row[group_by]: row['aggregate'] for row in results}
+        # (group, aggregate) tuples map straight onto the result without a dictionary per row
+        with get_pool(host, user, password, database, port, role="replica").get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query)
+            return dict(cursor.fetchall())
 
     except Error as e:
-        logger.error(f"Error fetching grouped data from '{table_name}': {str(e)}")
+        logger.error("Error fetching grouped data from '%s': %s", table_name, e)
         return None
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
 
-def execute_custom_query(host: str, user: str, password: str, database: str, query: str, port: int = 3306) -> Optional[List[Dict]]:
+def execute_custom_query(host: str, user: str, password: str, database: str, query: str, port: int = 3306, columnar: bool = False, prepared: bool = False) -> Optional[Union[List[Dict], Dict[str, list]]]:
     """
     Executes a custom SQL query and returns the result as a list of dictionaries.
 
+    The whole result is materialized in memory; use iter_custom_query() to stream large results instead.
+
     Args:
         host (str): The database host.
         user (str): The database user.
@@ -352,29 +520,221 @@ def execute_custom_query(host: str, user: str, password: str, database: str, que
         database (str): The database name.
         query (str): The SQL query to execute.
         port (int): The port number for the MySQL server.
+        columnar (bool): If True, return {"columns": [...], "rows": [...]} with tuple rows instead of one
+            dictionary per row, which is considerably cheaper for large results.
+        prepared (bool): If True, run a single statement as a cached prepared statement, so rows travel in
+            the binary protocol. The connector resets the statement before every execution, so this costs
+            one extra round-trip per call (two on first use); it can only pay off for large numeric or
+            temporal results, and should be measured against the default text protocol first.
 
     Returns:
-        Optional[List[Dict]]: The result of the query as a list of dictionaries, or None if an error occurs.
+        Optional[Union[List[Dict], Dict[str, list]]]: The result of the query as a list of dictionaries (or in columnar
+        shape), or None if an error occurs.
     """
-    connection = None
-    cursor = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host, user, password, database, port=port)
-        if not connection:
-            return None
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+        logger.debug("Executing custom query: %s", query)
+
+        # Custom SQL may write, so it always runs on the primary
+        with get_pool(host, user, password, database, port).get_connection() as connection:
+            if prepared:
+                result = fetch_columnar(execute_prepared(connection, query))
+            else:
+                with connection.cursor() as cursor:
+                    cursor.execute(query)
+                    result = fetch_columnar(cursor)
+        return result if columnar else to_dicts(result)
 
-        logger.info(f"Executing custom query: {query}")
-        cursor.execute(query)
-        rows = cursor.fetchall()
-        return rows
+    except Error as e:
+        logger.error("Error executing custom query: %s", e)
+        return None
+    finally:
+        # DDL may have run even if a later statement failed, so cached metadata is dropped either way
+        if not is_read_only(query):
+            invalidate_schema_cache(host, database)
+
+@contextlib.contextmanager
+def _streaming_cursor(host: str, user: str, password: str, database: str, port: int, dictionary: bool = True, role: str = "replica") -> Iterator[MySQLCursor]:
+    """
+    Borrows a pooled connection and opens an unbuffered cursor on it for the duration of the block.
 
+    Rows stay on the server until they are fetched, so the connection must be held until the
+    result has been read or the block exits.
+    """
+    with get_pool(host, user, password, database, port, role=role).get_connection() as connection, connection.cursor(buffered=False, dictionary=dictionary) as cursor:
+        yield cursor
+
+def _fetch_batches(cursor: MySQLCursor, query: str, params: Sequence[Any] = ()) -> Iterator[Any]:
+    """
+    Executes a query and yields its rows, pulling STREAM_BATCH_SIZE rows from the server at a time.
+    """
+    cursor.execute(query, params)
+    while True:
+        batch = cursor.fetchmany(STREAM_BATCH_SIZE)
+        if not batch:
+            return
+        yield from batch
+
+def iter_rows(host: str, user: str, password: str, database: str, table_name: str, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None, port: int = 3306) -> Iterator[Dict]:
+    """
+    Streams rows from the specified table one at a time instead of materializing the result set.
+
+    The query runs on an unbuffered cursor, so rows are read from the server as the generator is
+    advanced and memory use stays constant regardless of table size. The connection is held until
+    the generator is exhausted or closed.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The name of the table to stream rows from.
+        filters (Optional[Dict[str, Any]]): Column names mapped to the values they must equal.
+        limit (Optional[int]): The maximum number of rows to return, pushed down to the server.
+        port (int): The port number for the MySQL server.
+
+    Yields:
+        Dict: One dictionary per row.
+
+    Raises:
+        Error: If the connection fails or the query cannot be executed.
+    """
+    filters = filters or {}
+    query = _build_select(table_name, where=tuple(filters), suffix=" LIMIT %s" if limit is not None else "")
+    values = (*filters.values(), limit) if limit is not None else tuple(filters.values())
+
+    logger.debug("Streaming query: %s with values %s", query, values)
+    with _streaming_cursor(host, user, password, database, port) as cursor:
+        yield from _fetch_batches(cursor, query, values)
+
+def stream_rows(host: str, user: str, password: str, database: str, table_name: str, filters: Optional[Dict[str, Any]] = None, limit: Optional[int] = None, port: int = 3306) -> Optional[str]:
+    """
+    Retrieves rows from the specified table as newline-delimited JSON, one object per line.
+
+    Rows are serialized as they are streamed from the server, so no intermediate list of
+    dictionaries is built. The whole output is still one string in memory, so like get_all_rows it
+    is capped at DBMCP_MAX_ROWS rows; use iter_rows() to stream more.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The name of the table to stream rows from.
+        filters (Optional[Dict[str, Any]]): Column names mapped to the values they must equal.
+        limit (Optional[int]): The maximum number of rows to return. Defaults to, and is clamped to, DBMCP_MAX_ROWS.
+        port (int): The port number for the MySQL server.
+
+    Returns:
+        Optional[str]: The rows as newline-delimited JSON, or None if an error occurs.
+    """
+    if MAX_ROWS > 0:
+        limit = MAX_ROWS if limit is None else min(limit, MAX_ROWS)
+    try:
+        rows = iter_rows(host, user, password, database, table_name, filters, limit, port)
+        return "\n".join(json.dumps(row, default=str) for row in rows)
     except Error as e:
-        logger.error(f"Error executing custom query: {str(e)}")
+        logger.error("Error streaming rows from '%s': %s", table_name, e)
         return None
 
+def iter_all_rows(host: str, user: str, password: str, database: str, table_name: str, port: int = 3306) -> Iterator[Dict]:
+    """
+    Streams every row of the specified table, the generator counterpart of get_all_rows.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The name of the table to stream rows from.
+        port (int): The port number for the MySQL server.
+
+    Yields:
+        Dict: One dictionary per row.
+
+    Raises:
+        Error: If the connection fails or the query cannot be executed.
+    """
+    return iter_rows(host, user, password, database, table_name, port=port)
+
+def iter_sorted_rows(host: str, user: str, password: str, database: str, table_name: str, sort_by: str, order: str = 'ASC', port: int = 3306) -> Iterator[Dict]:
+    """
+    Streams the rows of the specified table in sorted order, the generator counterpart of get_sorted_rows.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table name.
+        sort_by (str): The column to sort by.
+        order (str): The sort order ('ASC' or 'DESC'). Default is 'ASC'.
+        port (int): The port number for the MySQL server.
+
+    Yields:
+        Dict: One dictionary per row.
+
+    Raises:
+        ValueError: If order is neither 'ASC' nor 'DESC'.
+        Error: If the connection fails or the query cannot be executed.
+    """
+    canonical_order = keyword_in(order, SORT_ORDERS)
+    if canonical_order is None:
+        raise ValueError(f"Invalid sort order: {order}")
+
+    query = _build_select(table_name, suffix=f" ORDER BY {quote_ident(sort_by)} {canonical_order}")
+    logger.debug("Streaming query: %s", query)
+    with _streaming_cursor(host, user, password, database, port) as cursor:
+        yield from _fetch_batches(cursor, query)
+
+def iter_distinct_values(host: str, user: str, password: str, database: str, table_name: str, column: str, port: int = 3306) -> Iterator[Any]:
+    """
+    Streams the distinct values of a column, the generator counterpart of get_distinct_values.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        table_name (str): The table name.
+        column (str): The column name.
+        port (int): The port number for the MySQL server.
+
+    Yields:
+        Any: One distinct value at a time.
+
+    Raises:
+        Error: If the connection fails or the query cannot be executed.
+    """
+    query = f"SELECT DISTINCT {quote_ident(column)} FROM {quote_ident(table_name)}"
+    logger.debug("Streaming query: %s", query)
+    with _streaming_cursor(host, user, password, database, port, dictionary=False) as cursor:
+        for row in _fetch_batches(cursor, query):
+            yield row[0]
+
+def iter_custom_query(host: str, user: str, password: str, database: str, query: str, port: int = 3306) -> Iterator[Dict]:
+    """
+    Streams the rows produced by a custom SQL query, the generator counterpart of execute_custom_query.
+
+    Args:
+        host (str): The database host.
+        user (str): The database user.
+        password (str): The database password.
+        database (str): The database name.
+        query (str): The SQL query to execute.
+        port (int): The port number for the MySQL server.
+
+    Yields:
+        Dict: One dictionary per row.
+
+    Raises:
+        Error: If the connection fails or the query cannot be executed.
+    """
+    logger.debug("Streaming custom query: %s", query)
+
+    # Custom SQL may write, so it always runs on the primary
+    try:
+        with _streaming_cursor(host, user, password, database, port, role="primary") as cursor:
+            yield from _fetch_batches(cursor, query)
     finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
\ No newline at end of file
+        if not is_read_only(query):
+            invalidate_schema_cache(host, database)
@@ -0,0 +1,59 @@
+from mysql.connector.cursor import MySQLCursor
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+def fetch_columnar(cursor: MySQLCursor) -> Dict[str, list]:
+    """
+    Fetches the remaining rows of a tuple cursor without building a dictionary per row.
+
+    Column names are stored once instead of being repeated as keys in every row, which also keeps
+    the JSON sent back to the MCP client compact.
+
+    Args:
+        cursor (MySQLCursor): A non-dictionary cursor that has executed a query.
+
+    Returns:
+        Dict[str, list]: {"columns": [column names], "rows": [row values in column order]}.
+    """
+    return {"columns": list(cursor.column_names), "rows": cursor.fetchall()}
+
+def rows_to_dicts(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Pairs tuple rows with their column names, for callers that need one mapping per row.
+
+    Args:
+        columns (Sequence[str]): The column names, in row order.
+        rows (Iterable[Sequence[Any]]): The row values.
+
+    Returns:
+        List[Dict[str, Any]]: A list of dictionaries keyed by column name.
+    """
+    return [dict(zip(columns, row)) for row in rows]
+
+def to_dicts(result: Dict[str, list]) -> List[Dict[str, Any]]:
+    """
+    Expands a columnar result into one dictionary per row, for callers that need mappings.
+
+    Args:
+        result (Dict[str, list]): A result produced by fetch_columnar.
+
+    Returns:
+        List[Dict[str, Any]]: A list of dictionaries keyed by column name.
+    """
+    return rows_to_dicts(result["columns"], result["rows"])
+
+def to_column_arrays(result: Dict[str, list]) -> Dict[str, Tuple[Any, ...]]:
+    """
+    Transposes a columnar result into one sequence of values per column.
+
+    Useful for vectorised processing of large results, where whole columns are consumed at once.
+
+    Args:
+        result (Dict[str, list]): A result produced by fetch_columnar.
+
+    Returns:
+        Dict[str, Tuple[Any, ...]]: Each column name mapped to its values, in row order.
+    """
+    columns = result["columns"]
+    if not result["rows"]:
+        return {column: () for column in columns}
+    return dict(zip(columns, zip(*result["rows"])))
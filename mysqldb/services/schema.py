@@ -1,15 +1,67 @@
 from config.logger_config import LoggerFactory
-from mysqldb.services.connection import connect_to_mysql
+from mysqldb.services.pool import get_pool
+from mysqldb.services.cache import memoize_ttl
 
 
-from typing import List, Optional, Dict
-from mysql.connector.cursor import MySQLCursor
+from typing import Any, List, Optional, Dict, Tuple
 from mysql.connector import Error
-from mysql.connector import MySQLConnection
+
+import functools
 
 
 logger = LoggerFactory.get_logger(__name__)
 
+# Every column of a database in one round-trip, in table and definition order
+_COLUMNS_QUERY = (
+    "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT "
+    "FROM information_schema.COLUMNS "
+    "WHERE TABLE_SCHEMA = %s "
+    "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+)
+
+# Primary key columns of one table, in key order
+_PRIMARY_KEY_QUERY = (
+    "SELECT COLUMN_NAME FROM information_schema.key_column_usage "
+    "WHERE table_schema = %s AND table_name = %s AND constraint_name = 'PRIMARY' "
+    "ORDER BY ORDINAL_POSITION"
+)
+
+@functools.lru_cache(maxsize=64)
+def _table_columns_query(table_count: int) -> str:
+    """
+    Builds the information_schema.COLUMNS query for a fixed number of tables, memoized per count.
+    """
+    placeholders = ", ".join(["%s"] * table_count)
+    return (
+        "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE, IS_NULLABLE, COLUMN_DEFAULT "
+        "FROM information_schema.COLUMNS "
+        f"WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) "
+        "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+    )
+
+def _group_columns(rows: List[Tuple[Any, ...]]) -> Dict[str, list]:
+    """
+    Groups information_schema.COLUMNS rows into column definitions per table.
+
+    Args:
+        rows (List[Tuple[Any, ...]]): (table, column, type, nullable, default) rows, ordered by table.
+
+    Returns:
+        Dict[str, list]: Table names mapped to their column definitions, in definition order.
+    """
+    schema: Dict[str, list] = {}
+    for table_name, column_name, column_type, is_nullable, default in rows:
+        schema.setdefault(table_name, []).append({
+            "column_name": column_name,
+            "properties": {
+                'Data Type': column_type,
+                'Nullable': is_nullable == 'YES',
+                'Default': default
+            }
+        })
+    return schema
+
+@memoize_ttl
 def get_tables(host:str, user:str, password:str, database:str, port:int=3306) -> Optional[List[str]]:
     """
     Retrieves the list of table names in a MySQL database.
@@ -24,39 +76,22 @@ def get_tables(host:str, user:str, password:str, database:str, port:int=3306) ->
     Returns:
         Optional[List[str]]: A list of table names if successful, otherwise None.
     """
-    connection = None
-    cursor = None
     try:
-        connection = connect_to_mysql(host=host, user=user, password=password, database=database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to MYSQL database: '{database}'")
-            return None
-
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
-
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
-
-        table_names = []
-        for table in tables:
-            for _, value in table.items():
-                table_names.append(value)
+        with get_pool(host, user, password, database, port).get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute("SHOW TABLES")
+            table_names = [row[0] for row in cursor.fetchall()]
 
         if(len(table_names) == 0):
-            logger.info(f"No tables inside database: '{database}'")
+            logger.info("No tables inside database: '%s'", database)
         else:
-            logger.info(f"Retrieved tables from database '{database}' successfully")
+            logger.info("Retrieved tables from database '%s' successfully", database)
 
         return table_names
     except Error as e:
-        logger.exception(f"Error while fetching tables from MySQL database '{database}': {str(e)}")
+        logger.exception("Error while fetching tables from MySQL database '%s': %s", database, e)
         return None
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
 
+@memoize_ttl
 def get_schema(host:str, user:str, password:str, database:str, port:int=3306) -> Optional[Dict[str, list]]:
     """
     Retrieves the schema of a given MySQL database as a dictionary.
@@ -72,53 +107,57 @@ def get_schema(host:str, user:str, password:str, database:str, port:int=3306) ->
         Optional[Dict[str, list]]: A dictionary where keys are table names and values are lists of column definitions.
         Returns None if the connection or table retrieval fails.
     """
-    connection = None
-    cursor = None
     try:
-        connection: MySQLConnection = connect_to_mysql(host=host, user=user, password=password, database=database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database : '{database}'")
-            return None
-
-        cursor: MySQLCursor = connection.cursor(dictionary=True)
+        with get_pool(host, user, password, database, port).get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_COLUMNS_QUERY, (database,))
+            rows = cursor.fetchall()
 
-        tables = get_tables(host=host, user=user, password=password, database=database, port=port)
-        if not tables:
-            logger.error(f"Failed to fetch tables from database")   
+        schema = _group_columns(rows)
+        if not schema:
+            logger.error("Failed to fetch tables from database")
             return None
-        schema = {}
-
-        
-        for table_name in tables:
-            cursor.execute(f"DESCRIBE {table_name}")
-            columns:list = cursor.fetchall()
-            
-            column_info = []
-            for column in columns:
-                column_properties:dict = {}
-                column_properties['Data Type'] = column['Type']
-                column_properties['Nullable'] = True if column['Null'] == 'YES' else False
-                column_properties['Default'] = column['Default']
-    
-                column_info.append({
-                    "column_name": column['Field'],
-                    "properties": column_properties
-                })
-
-            schema[table_name] = column_info
-        
-        logger.info(f"Schema retrieval completed for database: '{database}'")
+
+        logger.info("Schema retrieval completed for database: '%s'", database)
         return schema
-    
+
     except Error as e:
-        logger.error(f"An error occurred while retrieving schema: {str(e)}")
+        logger.error("An error occurred while retrieving schema: %s", e)
         return None
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
-    
+
+@memoize_ttl
+def get_table_descriptions(host:str, user: str, password:str, database:str, tables:List[str], port:int=3306) -> Optional[Dict[str, list]]:
+    """
+    Retrieves the schemas of several tables from a given MySQL database in a single round-trip.
+
+    Args:
+        host (str): The host address of the MySQL server.
+        user (str): The username to authenticate with.
+        password (str): The password for the MySQL user.
+        database (str): The name of the database containing the tables.
+        tables (List[str]): The names of the tables to retrieve the schemas of.
+        port (int): The port number of the MySQL server.
+
+    Returns:
+        Optional[Dict[str, list]]: A dictionary where keys are table names and values are lists of column definitions.
+        Tables that do not exist are left out. Returns None if the connection or schema retrieval fails.
+    """
+    if not tables:
+        return {}
+
+    try:
+        query = _table_columns_query(len(tables))
+        with get_pool(host, user, password, database, port).get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(query, (database, *tables))
+            rows = cursor.fetchall()
+
+        table_descriptions = _group_columns(rows)
+        logger.info("Descriptions fetched for %d of %d tables", len(table_descriptions), len(tables))
+        return table_descriptions
+    except Error as e:
+        logger.error("An error occurred while retrieving table descriptions: %s", e)
+        return None
+
+@memoize_ttl
 def get_table_description(host:str, user: str, password:str, database:str, table_name:str, port:int=3306) -> Optional[Dict[str, list]]:
     """
     Retrieves the schema of a specific table from a given MySQL database.
@@ -135,40 +174,32 @@ def get_table_description(host:str, user: str, password:str, database:str, table
         Optional[Dict[str, list]]: A dictionary where the key is the table name and the value is a list of column definitions.
         Returns None if the connection or schema retrieval fails.
     """
-    connection = None
-    cursor = None
-    try:
-        connection = connect_to_mysql(host=host, user=user, password=password, database=database, port=port)
-        if not connection:
-            logger.error(f"Failed to connect to database : '{database}'")
-            return None
-        cursor = connection.cursor(dictionary=True)
-
-        cursor.execute(f"DESCRIBE {table_name}")
-        columns = cursor.fetchall()
-
-        table_description = {}
-        column_info = []
-        for column in columns:
-            column_properties:dict = {}
-            column_properties['Data Type'] = column['Type']
-            column_properties['Nullable'] = True if column['Null'] == 'YES' else False
-            column_properties['Default'] = column['Default']
+    table_description = get_table_descriptions(host, user, password, database, [table_name], port)
+    if table_description == {}:
+        logger.error("Table '%s' does not exist in database '%s'", table_name, database)
+        return None
+    return table_description
 
-            column_info.append({
-                "column_name": column['Field'],
-                "properties": column_properties
-            })
+@memoize_ttl
+def get_primary_key(host:str, user: str, password:str, database:str, table_name:str, port:int=3306) -> Optional[List[str]]:
+    """
+    Retrieves the primary key columns of a table, in key order.
 
-        table_description[table_name] = column_info
+    Args:
+        host (str): The host address of the MySQL server.
+        user (str): The username to authenticate with.
+        password (str): The password for the MySQL user.
+        database (str): The name of the database containing the table.
+        table_name (str): The name of the table.
+        port (int): The port number of the MySQL server.
 
-        logger.info(f"Description fetched for table: '{table_name}'")
-        return table_description
+    Returns:
+        Optional[List[str]]: The primary key column names, empty if the table has none, or None if the lookup fails.
+    """
+    try:
+        with get_pool(host, user, password, database, port).get_connection() as connection, connection.cursor() as cursor:
+            cursor.execute(_PRIMARY_KEY_QUERY, (database, table_name))
+            return [row[0] for row in cursor.fetchall()]
     except Error as e:
-        logger.error(f"An error occurred while retrieving table description: {str(e)}")
+        logger.error("Error while retrieving the primary key of '%s': %s", table_name, e)
         return None
-    finally:
-        if cursor:
-            cursor.close()
-        if connection:
-            connection.close()
\ No newline at end of file
@@ -0,0 +1,75 @@
+from typing import FrozenSet, Optional
+
+import functools
+import re
+
+# Characters MySQL accepts in an unquoted identifier (ASCII subset)
+_IDENTIFIER = re.compile(r"[A-Za-z0-9_$]+")
+
+# Leading keywords of statements that cannot change data or schema
+_READ_ONLY = re.compile(r"\s*(SELECT|SHOW|DESCRIBE|DESC|EXPLAIN)\b", re.IGNORECASE)
+
+# Aggregate functions and sort orders that may be spliced into generated SQL
+AGGREGATIONS = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX"})
+SORT_ORDERS = frozenset({"ASC", "DESC"})
+
+@functools.lru_cache(maxsize=4096)
+def quote_ident(name: str) -> str:
+    """
+    Quotes a MySQL identifier (table, column or index name) with backticks.
+
+    Embedded backticks are doubled, so the name can never close the quote and inject SQL. Quoting
+    every identifier also makes generated statements byte-for-byte identical for identical shapes,
+    so memoized statement templates are shared. Schemas are small and stable, so results
+    are memoized and a repeated name costs a single dictionary lookup.
+
+    Args:
+        name (str): The identifier, unquoted.
+
+    Returns:
+        str: The quoted identifier.
+    """
+    return "`" + name.replace("`", "``") + "`"
+
+def is_identifier(name: str) -> bool:
+    """
+    Checks that a name is a plain MySQL identifier, so malformed names are rejected before any
+    statement is sent to the server.
+
+    Args:
+        name (str): The identifier, unquoted.
+
+    Returns:
+        bool: True if the name only uses letters, digits, underscores and dollar signs.
+    """
+    return isinstance(name, str) and _IDENTIFIER.fullmatch(name) is not None
+
+@functools.lru_cache(maxsize=256)
+def keyword_in(value: str, allowed: FrozenSet[str]) -> Optional[str]:
+    """
+    Matches a SQL keyword such as a sort order or aggregate function against an allow-list.
+
+    Args:
+        value (str): The keyword as given by the caller, in any case.
+        allowed (FrozenSet[str]): The upper-case keywords that may be spliced into SQL.
+
+    Returns:
+        Optional[str]: The upper-case keyword if it is allowed, otherwise None.
+    """
+    keyword = value.upper() if isinstance(value, str) else None
+    return keyword if keyword in allowed else None
+
+def is_read_only(query: str) -> bool:
+    """
+    Conservatively checks that custom SQL is a single statement that cannot change data or schema.
+
+    Anything unrecognised, including statements behind a leading comment and multi-statement text,
+    counts as a write.
+
+    Args:
+        query (str): The SQL text.
+
+    Returns:
+        bool: True if the query is a single SELECT, SHOW, DESCRIBE or EXPLAIN statement.
+    """
+    return _READ_ONLY.match(query) is not None and ";" not in query.strip().rstrip(";")
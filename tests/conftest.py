@@ -0,0 +1,118 @@
+from mysql.connector.errors import OperationalError
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+class FakeCursor:
+    """
+    Records executed statements and serves a fixed result, standing in for a connector cursor.
+    """
+
+    def __init__(self, connection: 'FakeConnection', prepared: bool = False, dictionary: bool = False):
+        self.connection = connection
+        self.prepared = prepared
+        self.dictionary = dictionary
+        self.closed = False
+        self.column_names: Tuple[str, ...] = ()
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> None:
+        self.connection.check_alive()
+        self.connection.executed.append((query, tuple(params or ())))
+        if self.connection.fail_with is not None and query.startswith(self.connection.fail_on):
+            raise self.connection.fail_with
+        self.column_names, rows = self.connection.results.get(query, self.connection.result)
+        self._rows = list(rows)
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self._rows.pop(0) if self._rows else None
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __enter__(self) -> 'FakeCursor':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+class FakeConnection:
+    """
+    An in-memory stand-in for a MySQL connection that records what the pool does with it.
+
+    Set alive to False to make every server round-trip fail, as a dropped connection would, and
+    fail_with to make statements starting with fail_on raise that exception.
+    """
+
+    def __init__(self, **config: Any):
+        self.config = config
+        self.alive = True
+        self.closed = False
+        self.in_transaction = False
+        self.autocommit = True
+        self.database = config.get("database")
+        self.executed: List[Tuple[str, Tuple[Any, ...]]] = []
+        self.result: Tuple[Tuple[str, ...], List[Tuple[Any, ...]]] = ((), [])
+        self.results: Dict[str, Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]] = {
+            "SELECT @@max_allowed_packet": (("@@max_allowed_packet",), [(64 * 1024 * 1024,)]),
+        }
+        self.fail_on = ""
+        self.fail_with: Optional[BaseException] = None
+        self.commits = 0
+        self.pings = 0
+        self.resets = 0
+        self.reconnects = 0
+
+    def check_alive(self) -> None:
+        if not self.alive:
+            raise OperationalError("Lost connection to MySQL server during query")
+
+    def cursor(self, prepared: bool = False, dictionary: bool = False, **kwargs: Any) -> FakeCursor:
+        return FakeCursor(self, prepared, dictionary)
+
+    def ping(self, reconnect: bool = False, attempts: int = 1, delay: int = 0) -> None:
+        self.pings += 1
+        if not self.alive and reconnect and self.config.get("reconnectable", False):
+            self.alive = True
+            self.reconnects += 1
+        self.check_alive()
+
+    def cmd_reset_connection(self) -> bool:
+        self.check_alive()
+        self.resets += 1
+        return True
+
+    def cmd_init_db(self, database: str) -> None:
+        self.check_alive()
+        self.database = database
+
+    def commit(self) -> None:
+        self.check_alive()
+        self.commits += 1
+        self.in_transaction = False
+
+    def rollback(self) -> None:
+        self.check_alive()
+        self.in_transaction = False
+
+    def close(self) -> None:
+        self.closed = True
+
+@pytest.fixture
+def fake_connect(monkeypatch: pytest.MonkeyPatch) -> List[FakeConnection]:
+    """
+    Replaces the connector's connect() in the pool module; returns the list of connections it opened.
+    """
+    opened: List[FakeConnection] = []
+
+    def connect(**config: Any) -> FakeConnection:
+        connection = FakeConnection(**config)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr("mysqldb.services.pool.connect", connect)
+    return opened
@@ -0,0 +1,101 @@
+from mysql.connector.errors import DatabaseError
+from mysqldb.services import dml
+from mysqldb.services.dml import AsyncInsertBuffer, _tsv_field
+from mysqldb.services.pool import ConnectionPool
+
+import pytest
+
+@pytest.mark.parametrize("value, field", [
+    (None, b"\\N"),
+    (True, b"1"),
+    (False, b"0"),
+    (42, b"42"),
+    ("plain", b"plain"),
+    ("tab\there", b"tab\\there"),
+    ("line\nbreak\r", b"line\\nbreak\\r"),
+    ("back\\slash", b"back\\\\slash"),
+    ("nul\0byte", b"nul\\0byte"),
+    ("\\N", b"\\\\N"),
+    ("café", "café".encode("utf-8")),
+    (b"\x00\t\\raw", b"\\0\\t\\\\raw"),
+    (bytearray(b"a\nb"), b"a\\nb"),
+])
+def test_tsv_field_escapes_like_load_data(value, field):
+    assert _tsv_field(value) == field
+
+@pytest.fixture
+def pool(fake_connect, monkeypatch):
+    pool = ConnectionPool(2, database="shop")
+    monkeypatch.setattr(dml, "get_pool", lambda *args, **kwargs: pool)
+    return pool
+
+@pytest.fixture
+def buffer():
+    buffer = AsyncInsertBuffer(wait_time_ms=50)
+    yield buffer
+    buffer.close()
+
+def _submit(buffer, table_name, data):
+    return buffer.submit("localhost", "user", "secret", "shop", table_name, data)
+
+def _inserts(connection):
+    return [(query, params) for query, params in connection.executed if query.startswith("INSERT")]
+
+def test_buffered_rows_are_coalesced_into_one_insert(pool, fake_connect, buffer):
+    futures = [_submit(buffer, "users", {"id": i, "name": f"user{i}"}) for i in range(3)]
+
+    assert [future.result(timeout=5) for future in futures] == [True, True, True]
+    connection = fake_connect[0]
+    assert _inserts(connection) == [(
+        "INSERT INTO `users` (`id`, `name`) VALUES (%s, %s), (%s, %s), (%s, %s)",
+        (0, "user0", 1, "user1", 2, "user2"),
+    )]
+    assert connection.commits == 1
+
+def test_rows_are_grouped_by_table_and_columns(pool, fake_connect, buffer):
+    futures = [
+        _submit(buffer, "users", {"id": 1}),
+        _submit(buffer, "orders", {"id": 1}),
+        _submit(buffer, "users", {"id": 2, "name": "b"}),
+    ]
+
+    assert [future.result(timeout=5) for future in futures] == [True, True, True]
+    inserts = [query for connection in fake_connect for query, _ in _inserts(connection)]
+    assert sorted(inserts) == sorted([
+        "INSERT INTO `users` (`id`) VALUES (%s)",
+        "INSERT INTO `orders` (`id`) VALUES (%s)",
+        "INSERT INTO `users` (`id`, `name`) VALUES (%s, %s)",
+    ])
+
+def test_rejected_batch_resolves_to_false(pool, fake_connect, buffer):
+    pool.get_connection().close()
+    fake_connect[0].fail_on = "INSERT"
+    fake_connect[0].fail_with = DatabaseError("Duplicate entry '1' for key 'PRIMARY'")
+
+    futures = [_submit(buffer, "users", {"id": 1}), _submit(buffer, "users", {"id": 2})]
+
+    assert [future.result(timeout=5) for future in futures] == [False, False]
+    assert fake_connect[0].commits == 0
+
+def test_unexpected_error_is_set_on_every_future(pool, fake_connect, buffer):
+    pool.get_connection().close()
+    fake_connect[0].fail_on = "INSERT"
+    fake_connect[0].fail_with = TypeError("Python type object cannot be converted")
+
+    futures = [_submit(buffer, "users", {"id": 1}), _submit(buffer, "users", {"id": 2})]
+
+    for future in futures:
+        with pytest.raises(TypeError):
+            future.result(timeout=5)
+
+    # The worker survives the failure and keeps serving later rows
+    fake_connect[0].fail_with = None
+    assert _submit(buffer, "users", {"id": 3}).result(timeout=5) is True
+
+def test_close_flushes_queued_rows(pool, fake_connect):
+    buffer = AsyncInsertBuffer(wait_time_ms=60_000)
+    future = _submit(buffer, "users", {"id": 1})
+    buffer.close()
+
+    assert future.result(timeout=0) is True
+    assert buffer._worker is None
@@ -0,0 +1,140 @@
+from mysql.connector.errors import OperationalError, PoolError
+from mysqldb.services import pool as pool_module
+from mysqldb.services.pool import ConnectionPool, statement_cache
+
+import pytest
+
+@pytest.fixture
+def pool(fake_connect):
+    return ConnectionPool(2, database="shop")
+
+def test_released_connection_is_reused(pool, fake_connect):
+    first = pool.get_connection()
+    raw = first._connection
+    first.close()
+
+    second = pool.get_connection()
+    assert second._connection is raw
+    assert len(fake_connect) == 1
+    second.close()
+
+def test_close_is_idempotent(pool, fake_connect):
+    connection = pool.get_connection()
+    connection.close()
+    connection.close()
+
+    assert len(pool._idle) == 1
+    assert fake_connect[0].resets == 1
+
+def test_release_resets_the_session(pool, fake_connect):
+    connection = pool.get_connection()
+    raw = connection._connection
+    statement_cache(raw).get("SELECT %s")
+    raw.database = "other"  # as left behind by USE other
+    connection.close()
+
+    assert raw.resets == 1
+    assert raw.database == "shop"
+    assert not statement_cache(raw)._cursors
+
+def test_release_restores_autocommit_after_rolling_back(pool, fake_connect):
+    connection = pool.get_connection()
+    connection.disable_autocommit()
+    connection._connection.in_transaction = True
+    connection.close()
+
+    raw = fake_connect[0]
+    assert not raw.in_transaction
+    assert raw.autocommit is True
+
+def test_connection_that_died_while_borrowed_is_discarded(pool, fake_connect):
+    connection = pool.get_connection()
+    fake_connect[0].alive = False
+    connection.close()
+
+    assert fake_connect[0].closed
+    assert not pool._idle
+
+    # The next borrow must not be handed the dead connection, even within the idle TTL
+    replacement = pool.get_connection()
+    assert replacement._connection is fake_connect[1]
+    replacement.close()
+
+def test_connection_error_in_with_block_discards_the_connection(pool, fake_connect):
+    with pytest.raises(OperationalError):
+        with pool.get_connection():
+            raise OperationalError("Lost connection to MySQL server during query")
+
+    assert fake_connect[0].closed
+    assert fake_connect[0].resets == 0
+    assert not pool._idle
+
+def test_idle_connection_within_ttl_skips_the_ping(pool, fake_connect):
+    pool.get_connection().close()
+    pool.get_connection().close()
+
+    assert fake_connect[0].pings == 0
+
+def test_idle_connection_past_ttl_is_pinged(pool, fake_connect, monkeypatch):
+    monkeypatch.setattr(pool_module, "IDLE_TTL_MS", 0)
+    pool.get_connection().close()
+    pool.get_connection().close()
+
+    assert fake_connect[0].pings == 1
+    assert len(fake_connect) == 1
+
+def test_idle_connection_that_timed_out_is_revived(fake_connect, monkeypatch):
+    monkeypatch.setattr(pool_module, "IDLE_TTL_MS", 0)
+    pool = ConnectionPool(1, database="shop", reconnectable=True)
+    pool.get_connection().close()
+    raw = fake_connect[0]
+    statement_cache(raw).get("SELECT %s")
+    raw.alive = False
+
+    connection = pool.get_connection()
+    assert connection._connection is raw
+    assert raw.reconnects == 1
+    assert not statement_cache(raw)._cursors
+    connection.close()
+
+def test_idle_connection_that_cannot_reconnect_is_replaced(pool, fake_connect, monkeypatch):
+    monkeypatch.setattr(pool_module, "IDLE_TTL_MS", 0)
+    pool.get_connection().close()
+    fake_connect[0].alive = False
+
+    connection = pool.get_connection()
+    assert connection._connection is fake_connect[1]
+    assert fake_connect[0].closed
+    connection.close()
+
+def test_pool_size_is_bounded(pool, fake_connect, monkeypatch):
+    monkeypatch.setattr(pool_module, "POOL_TIMEOUT", 0.01)
+    first, second = pool.get_connection(), pool.get_connection()
+    with pytest.raises(PoolError):
+        pool.get_connection()
+
+    first.close()
+    third = pool.get_connection()
+    assert third._connection is fake_connect[0]
+    second.close()
+    third.close()
+
+def test_discarded_connection_frees_its_slot(pool, fake_connect, monkeypatch):
+    monkeypatch.setattr(pool_module, "POOL_TIMEOUT", 0.01)
+    first, second = pool.get_connection(), pool.get_connection()
+    fake_connect[0].alive = False
+    first.close()
+
+    third = pool.get_connection()
+    assert len(fake_connect) == 3
+    second.close()
+    third.close()
+
+def test_closed_pool_discards_released_connections(pool, fake_connect):
+    idle, borrowed = pool.get_connection(), pool.get_connection()
+    idle.close()
+    pool.close()
+    assert fake_connect[0].closed
+
+    borrowed.close()
+    assert fake_connect[1].closed
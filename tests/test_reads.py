@@ -0,0 +1,30 @@
+from mysqldb.services import reads
+from mysqldb.services.pool import ConnectionPool
+
+import pytest
+
+# Comment markers and doubled whitespace inside literals must reach the server untouched
+QUERY = "SELECT id, 5--3 AS n FROM users WHERE name = 'a--b' AND note = 'two  spaces' -- trailing comment"
+
+@pytest.fixture
+def connection(fake_connect, monkeypatch):
+    pool = ConnectionPool(1, database="shop")
+    monkeypatch.setattr(reads, "get_pool", lambda *args, **kwargs: pool)
+
+    # Open the pool's only connection up front so its result can be set
+    pool.get_connection().close()
+    connection = fake_connect[0]
+    connection.result = (("id", "n"), [(1, 8)])
+    return connection
+
+@pytest.mark.parametrize("prepared", [False, True])
+def test_custom_query_runs_the_callers_sql_verbatim(connection, prepared):
+    result = reads.execute_custom_query("localhost", "user", "secret", "shop", QUERY, columnar=True, prepared=prepared)
+
+    assert connection.executed == [(QUERY, ())]
+    assert result == {"columns": ["id", "n"], "rows": [(1, 8)]}
+
+@pytest.mark.parametrize("values", [[1, [2, 3]], [{"id": 1}]])
+def test_rows_in_rejects_nested_values(connection, values):
+    assert reads.get_rows_in("localhost", "user", "secret", "shop", "users", "id", values) is None
+    assert connection.executed == []